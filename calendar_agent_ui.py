@@ -1,25 +1,25 @@
 # Simple Streamlit UI for Google Calendar Agent
 
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import os
-import json
+import asyncio
 import logging
-from datetime import datetime, timezone, timedelta
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, time, timezone, timedelta
 from typing import Optional
 
 # Import calendar agent functions
 from google_calendar_agent import (
     process_calendar_request,
-    check_if_calendar_event,
-    determine_calendar_request_type,
+    classify_request,
     get_calendar_events,
     get_tasks,
-    create_new_event,
-    create_task,
-    modify_event,
-    modify_task,
     delete_event,
     delete_task,
+    warm_up_model_client,
+    get_service,
 )
 
 # Google Calendar / Tasks authentication imports
@@ -27,7 +27,6 @@ from google.auth.exceptions import RefreshError
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
 # Configure logging
@@ -40,36 +39,90 @@ SCOPES = [
     "https://www.googleapis.com/auth/tasks",
 ]
 
-def get_google_credentials():
-    """Get or create Google Calendar/Tasks credentials.
+# Width shared by the full-width action buttons (replaces the deprecated use_container_width)
+BUTTON_WIDTH = "stretch"
+
+# Sidebar navigation pages, in display order
+PAGES = ("🏠 Home", "➕ Create", "🔍 Search", "✏️ Modify", "🗑️ Delete", "⚙️ Settings")
+
+# How often, in seconds, a page checks whether its background request has finished
+REQUEST_POLL_INTERVAL = 0.5
+
+# Start refreshing the access token in the background once it is this close to expiry
+TOKEN_REFRESH_WINDOW = timedelta(minutes=5)
+
+@st.cache_data(ttl=5, show_spinner=False)
+def get_file_state():
+    """Return whether credentials.json and token.json exist, briefly cached across reruns."""
+    return {name: os.path.exists(name) for name in ("credentials.json", "token.json")}
+
+def save_token(creds):
+    """Persist credentials to token.json."""
+    with open("token.json", "w") as token:
+        token.write(creds.to_json())
+    get_file_state.clear()
+
+def discard_token():
+    """Remove token.json, ignoring a file that is already gone."""
+    try:
+        os.remove("token.json")
+    except OSError:
+        pass
+    get_file_state.clear()
+
+def refresh_and_save_token(creds):
+    """Refresh the access token and persist the new one."""
+    creds.refresh(Request())
+    save_token(creds)
+
+class TokenRefresher:
+    """Runs at most one background token refresh at a time."""
+
+    def __init__(self):
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="token-refresh")
+        self._lock = threading.Lock()
+        self._future = None
+
+    def schedule(self, creds):
+        """Start a refresh unless one is already in flight, and return its future."""
+        with self._lock:
+            if self._future is None or self._future.done():
+                self._future = self._executor.submit(refresh_and_save_token, creds)
+            return self._future
+
+@st.cache_resource(show_spinner=False)
+def get_token_refresher():
+    """Share one TokenRefresher across reruns and sessions."""
+    return TokenRefresher()
+
+@st.cache_resource(show_spinner=False)
+def load_google_credentials(force_consent_prompt=False):
+    """Load or create Google Calendar/Tasks credentials.
+
+    The Credentials object is cached across reruns, so token.json is only read
+    again after the cache is cleared (see clear_google_credentials).
 
     If the saved refresh token is revoked or invalid (invalid_grant), we remove
     token.json and run the browser flow again instead of failing permanently.
     """
     creds = None
-    force_consent_prompt = False
 
-    if os.path.exists("token.json"):
+    if get_file_state()["token.json"]:
         creds = Credentials.from_authorized_user_file("token.json", SCOPES)
 
     if creds and creds.expired and creds.refresh_token:
         try:
-            creds.refresh(Request())
-            with open("token.json", "w") as token:
-                token.write(creds.to_json())
+            refresh_and_save_token(creds)
         except RefreshError:
             # Revoked refresh token, wrong OAuth client, or stale token file.
             force_consent_prompt = True
             creds = None
-            try:
-                os.remove("token.json")
-            except OSError:
-                pass
+            discard_token()
 
     if not creds or not creds.valid:
-        if not os.path.exists("credentials.json"):
-            st.error("❌ credentials.json file not found. Please download it from Google Cloud Console.")
-            st.stop()
+        if not get_file_state()["credentials.json"]:
+            # Raised rather than shown with st.error, since this may run on a preload thread
+            raise FileNotFoundError("credentials.json file not found. Please download it from Google Cloud Console.")
 
         flow = InstalledAppFlow.from_client_secrets_file("credentials.json", SCOPES)
         oauth_kwargs = {"port": 0, "access_type": "offline"}
@@ -77,11 +130,97 @@ def get_google_credentials():
             oauth_kwargs["prompt"] = "consent"
         creds = flow.run_local_server(**oauth_kwargs)
 
-        with open("token.json", "w") as token:
-            token.write(creds.to_json())
+        save_token(creds)
+
+    return creds
+
+def get_google_credentials():
+    """Return the cached credentials, refreshing them before they expire.
+
+    Once the token is within TOKEN_REFRESH_WINDOW of expiry a refresh is started
+    in the background and the current token is returned right away. The caller
+    only waits for the refresh if the token has actually expired.
+    """
+    creds = load_google_credentials()
+
+    now = datetime.now(timezone.utc).replace(tzinfo=None)  # Credentials.expiry is naive UTC
+    if creds.refresh_token and creds.expiry and creds.expiry - now < TOKEN_REFRESH_WINDOW:
+        refresh = get_token_refresher().schedule(creds)
+        if not creds.valid:
+            try:
+                refresh.result()
+            except RefreshError:
+                discard_token()
+                clear_google_credentials()
+                return load_google_credentials(force_consent_prompt=True)
+
+    if not creds.valid:
+        clear_google_credentials()
+        creds = load_google_credentials()
 
     return creds
 
+def get_calendar_service(creds):
+    """Return the calling thread's Google Calendar API client for these credentials.
+
+    httplib2 transports are not thread-safe, so the agent's per-thread client
+    cache is reused rather than sharing one client across Streamlit sessions.
+    It builds from the bundled discovery document, never fetching it over HTTP.
+    """
+    return get_service("calendar", "v3", creds)
+
+def clear_google_credentials():
+    """Drop the cached credentials; clients are keyed by credentials, so new ones get new clients."""
+    load_google_credentials.clear()
+
+# Custom CSS for better styling
+CUSTOM_CSS = """
+<style>
+.success-box {
+    background-color: #d4edda;
+    border: 1px solid #c3e6cb;
+    border-radius: 5px;
+    padding: 1rem;
+    margin: 1rem 0;
+}
+.error-box {
+    background-color: #f8d7da;
+    border: 1px solid #f5c6cb;
+    border-radius: 5px;
+    padding: 1rem;
+    margin: 1rem 0;
+}
+.info-box {
+    background-color: #d1ecf1;
+    border: 1px solid #bee5eb;
+    border-radius: 5px;
+    padding: 1rem;
+    margin: 1rem 0;
+}
+</style>
+"""
+
+@st.cache_data(show_spinner=False)
+def inject_custom_css():
+    """Emit CUSTOM_CSS. Later calls replay the cached element instead of re-running."""
+    st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+@st.cache_resource(show_spinner=False)
+def preload_google_credentials():
+    """Start loading the Google credentials on a background thread.
+
+    Runs once per process, as soon as the app starts, so the OAuth token load
+    overlaps with rendering the first page. Later calls to get_google_credentials
+    then find the credentials cache filled, or wait for the in-flight load instead
+    of starting another.
+    """
+    # A throwaway thread rather than the shared request pool, so the starting
+    # session's script run context (which the cache functions need) dies with it
+    thread = threading.Thread(target=get_google_credentials, name="credentials-preload", daemon=True)
+    add_script_run_ctx(thread, get_script_run_ctx())
+    thread.start()
+    return thread
+
 def main():
     st.set_page_config(
         page_title="Google Calendar Agent",
@@ -90,52 +229,17 @@ def main():
         initial_sidebar_state="expanded"
     )
 
-    # Custom CSS for better styling
-    st.markdown("""
-    <style>
-    .success-box {
-        background-color: #d4edda;
-        border: 1px solid #c3e6cb;
-        border-radius: 5px;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    .error-box {
-        background-color: #f8d7da;
-        border: 1px solid #f5c6cb;
-        border-radius: 5px;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    .info-box {
-        background-color: #d1ecf1;
-        border: 1px solid #bee5eb;
-        border-radius: 5px;
-        padding: 1rem;
-        margin: 1rem 0;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    preload_google_credentials()
+    # Starting the agent's event loop also opens its Gemini connection
+    get_event_loop()
+
+    inject_custom_css()
 
     # Sidebar for navigation
     st.sidebar.title("Navigation")
 
-    # Initialize page in session state
-    if "page" not in st.session_state:
-        st.session_state.page = "🏠 Home"
-
-    pages = ["🏠 Home", "➕ Create", "🔍 Search", "✏️ Modify", "🗑️ Delete", "⚙️ Settings"]
-
-    page = st.sidebar.selectbox(
-        "Choose an action:",
-        pages,
-        index=pages.index(st.session_state.page)
-    )
-
-    # Update session state when sidebar changes
-    if page != st.session_state.page:
-        st.session_state.page = page
-        st.rerun()
+    # The widget key keeps the selected page in st.session_state.page across reruns
+    page = st.sidebar.selectbox("Choose an action:", PAGES, key="page")
 
     # Check API key
     if not os.environ.get("GOOGLE_API_KEY"):
@@ -159,50 +263,67 @@ def main():
     # Fetch calendar owner name once and cache in session state
     if "calendar_owner_name" not in st.session_state:
         try:
-            service = build("calendar", "v3", credentials=creds)
+            service = get_calendar_service(creds)
             calendar_info = service.calendars().get(calendarId="primary").execute()
             st.session_state.calendar_owner_name = calendar_info.get("summary", "")
         except Exception:
             st.session_state.calendar_owner_name = ""
 
-    # Main content based on selected page
-    if page == "🏠 Home":
-        show_home_page(creds, st.session_state.calendar_owner_name)
+    # Main content based on selected page. Each page is an st.fragment, so widget
+    # interactions inside it rerun only that page rather than the whole script.
+    PAGE_ROUTES[page](creds)
 
-    elif page == "➕ Create":
-        show_create_page(creds)
-
-    elif page == "🔍 Search":
-        show_search_page(creds)
-
-    elif page == "✏️ Modify":
-        show_modify_page(creds)
-
-    elif page == "🗑️ Delete":
-        show_delete_page(creds)
-
-    elif page == "⚙️ Settings":
-        show_settings_page()
-
-def get_upcoming_events(creds, max_results=5):
+def get_upcoming_events(service, max_results=5):
     """Fetch the next upcoming events from Google Calendar."""
     try:
-        service = build("calendar", "v3", credentials=creds)
         now = datetime.now(timezone.utc).isoformat()
         events_result = service.events().list(
             calendarId="primary",
             timeMin=now,
             maxResults=max_results,
             singleEvents=True,
-            orderBy="startTime"
+            orderBy="startTime",
+            fields="items(summary,location,start,end,attendees(email),htmlLink)"
         ).execute()
         return events_result.get("items", []), None
     except HttpError as error:
         return [], str(error)
 
 
-def show_home_page(creds, owner_name=""):
+# Static page copy
+HOME_HOW_TO_USE_MD = """
+1. **Create**: Describe a meeting (with attendees), personal event, task, birthday, or anniversary in natural language
+2. **Search**: Find existing meetings, events, or tasks by description or date
+3. **Modify**: Update any meeting, event, or task by describing the change
+4. **Delete**: Remove meetings, events, or tasks with confirmation
+"""
+
+CREATE_INTRO_MD = (
+    "Describe what you want to create. The agent will automatically determine "
+    "whether it's a **meeting** (with attendees), a personal **event**, or a **task**."
+)
+
+MODIFY_INTRO_MD = (
+    "Describe the change you want to make. The agent will determine whether the item "
+    "is a **meeting**, **event**, or **task** and apply the update."
+)
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def format_day(day):
+    """Format a date for display, e.g. 'Monday, March 30, 2026'."""
+    return day.strftime("%A, %B %d, %Y")
+
+
+def go_to_page(page):
+    """Button callback that switches the sidebar page before the next rerun."""
+    st.session_state.page = page
+
+
+@st.fragment
+def show_home_page(creds):
     """Display the home page with overview and quick actions."""
+    owner_name = st.session_state.get("calendar_owner_name", "")
     greeting = f"Welcome to Your Calendar Agent, {owner_name}" if owner_name else "Welcome to Your Calendar Agent"
     st.markdown(f"## 🏠 {greeting}")
 
@@ -210,23 +331,22 @@ def show_home_page(creds, owner_name=""):
 
     with col1:
         st.markdown("### 🚀 Quick Actions")
-        if st.button("➕ Create Meeting, Event, or Task", use_container_width=True):
-            st.session_state.page = "➕ Create"
+        # Callbacks run before the rerun, when the sidebar widget's state may still
+        # be changed; st.rerun() then refreshes the whole app, not just this fragment.
+        if st.button("➕ Create Meeting, Event, or Task", width=BUTTON_WIDTH, on_click=go_to_page, args=("➕ Create",)):
             st.rerun()
 
-        if st.button("🔍 Search", use_container_width=True):
-            st.session_state.page = "🔍 Search"
+        if st.button("🔍 Search", width=BUTTON_WIDTH, on_click=go_to_page, args=("🔍 Search",)):
             st.rerun()
 
     with col2:
         st.markdown("### 📊 Today's Overview")
-        today = datetime.now().strftime("%A, %B %d, %Y")
-        st.info(f"Today is {today}")
+        st.info(f"Today is {format_day(date.today())}")
 
     st.markdown("---")
     st.markdown("### 🗓️ Upcoming Events")
 
-    events, error = get_upcoming_events(creds, max_results=5)
+    events, error = get_upcoming_events(get_calendar_service(creds), max_results=5)
 
     if error:
         st.error(f"❌ Could not load upcoming events: {error}")
@@ -234,8 +354,9 @@ def show_home_page(creds, owner_name=""):
         st.info("📭 No upcoming events found.")
     else:
         for event in events:
-            start_raw = event["start"].get("dateTime", event["start"].get("date", ""))
-            end_raw = event["end"].get("dateTime", event["end"].get("date", ""))
+            event_start, event_end = event["start"], event["end"]
+            start_raw = event_start.get("dateTime") or event_start.get("date", "")
+            end_raw = event_end.get("dateTime") or event_end.get("date", "")
 
             # Format datetime strings for display
             try:
@@ -269,12 +390,60 @@ def show_home_page(creds, owner_name=""):
 
     st.markdown("---")
     st.markdown("### 💡 How to Use")
-    st.markdown("""
-    1. **Create**: Describe a meeting (with attendees), personal event, task, birthday, or anniversary in natural language
-    2. **Search**: Find existing meetings, events, or tasks by description or date
-    3. **Modify**: Update any meeting, event, or task by describing the change
-    4. **Delete**: Remove meetings, events, or tasks with confirmation
-    """)
+    st.markdown(HOME_HOW_TO_USE_MD)
+
+
+@st.cache_resource(show_spinner=False)
+def get_request_executor():
+    """Thread pool, shared across reruns, for blocking work kept off the script thread."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="calendar-request")
+
+
+@st.cache_resource(show_spinner=False)
+def get_event_loop():
+    """Event loop, shared across reruns, that runs the agent's coroutines on a daemon thread.
+
+    The Gemini async client holds connections bound to the loop it first ran on, so
+    every request goes through this one loop rather than a fresh asyncio.run(). The
+    first connection is opened as soon as the loop starts.
+    """
+    loop = asyncio.new_event_loop()
+    threading.Thread(target=loop.run_forever, name="calendar-agent-loop", daemon=True).start()
+    asyncio.run_coroutine_threadsafe(warm_up_model_client(), loop)
+    return loop
+
+
+def run_async(coro):
+    """Schedule coro on the shared event loop and return its concurrent.futures.Future."""
+    return asyncio.run_coroutine_threadsafe(coro, get_event_loop())
+
+
+def submit_request(key, coro):
+    """Run coro in the background and keep its future in st.session_state[key]."""
+    st.session_state[key] = run_async(coro)
+
+
+@st.fragment(run_every=REQUEST_POLL_INTERVAL)
+def wait_for_request(key, message):
+    """Show message while the request under key runs, then rerun the app once it is done."""
+    if st.session_state[key].done():
+        st.rerun()
+    st.status(message, state="running")
+
+
+def finished_request(key, message):
+    """Return the finished future stored under key and remove it from session state.
+
+    Returns None if nothing was submitted or the request is still running. While it
+    runs, wait_for_request keeps polling without blocking the rest of the page.
+    """
+    request = st.session_state.get(key)
+    if request is None:
+        return None
+    if not request.done():
+        wait_for_request(key, message)
+        return None
+    return st.session_state.pop(key)
 
 
 def render_notification_controls(key_prefix: str) -> Optional[dict]:
@@ -284,6 +453,9 @@ def render_notification_controls(key_prefix: str) -> Optional[dict]:
         {"useDefault": False, "overrides": [{"method": "email", "minutes": 1440}]}
     Returns None when the user has not selected any notifications.
     Notifications are not supported for tasks.
+
+    The amount and unit inputs are always shown so the controls also work inside
+    an st.form, where ticking a checkbox does not rerun the script.
     """
     st.markdown("### 🔔 Notifications")
     st.caption("Supported for meetings and events. Not available for tasks.")
@@ -295,22 +467,22 @@ def render_notification_controls(key_prefix: str) -> Optional[dict]:
 
     with col1:
         email_on = st.checkbox("Email notification", key=f"{key_prefix}_email_on")
+        amt_col, unit_col = st.columns(2)
+        with amt_col:
+            email_amt = st.number_input("Amount", min_value=1, value=1, key=f"{key_prefix}_email_amt")
+        with unit_col:
+            email_unit = st.selectbox("Unit", ["days", "hours", "minutes"], key=f"{key_prefix}_email_unit")
         if email_on:
-            amt_col, unit_col = st.columns(2)
-            with amt_col:
-                email_amt = st.number_input("Amount", min_value=1, value=1, key=f"{key_prefix}_email_amt")
-            with unit_col:
-                email_unit = st.selectbox("Unit", ["days", "hours", "minutes"], key=f"{key_prefix}_email_unit")
             overrides.append({"method": "email", "minutes": int(email_amt * unit_to_minutes[email_unit])})
 
     with col2:
         popup_on = st.checkbox("Pop-up notification", key=f"{key_prefix}_popup_on")
+        amt_col, unit_col = st.columns(2)
+        with amt_col:
+            popup_amt = st.number_input("Amount", min_value=1, value=30, key=f"{key_prefix}_popup_amt")
+        with unit_col:
+            popup_unit = st.selectbox("Unit", ["minutes", "hours", "days"], key=f"{key_prefix}_popup_unit")
         if popup_on:
-            amt_col, unit_col = st.columns(2)
-            with amt_col:
-                popup_amt = st.number_input("Amount", min_value=1, value=30, key=f"{key_prefix}_popup_amt")
-            with unit_col:
-                popup_unit = st.selectbox("Unit", ["minutes", "hours", "days"], key=f"{key_prefix}_popup_unit")
             overrides.append({"method": "popup", "minutes": int(popup_amt * unit_to_minutes[popup_unit])})
 
     if overrides:
@@ -318,66 +490,93 @@ def render_notification_controls(key_prefix: str) -> Optional[dict]:
     return None
 
 
+@st.fragment
 def show_create_page(creds):
     """Page for creating new meetings, events, or tasks."""
     st.markdown("## ➕ Create Meeting, Event, or Task")
-    st.markdown(
-        "Describe what you want to create. The agent will automatically determine "
-        "whether it's a **meeting** (with attendees), a personal **event**, or a **task**."
-    )
+    st.markdown(CREATE_INTRO_MD)
+
+    # Inputs inside the form only trigger a rerun when the form is submitted
+    with st.form("create_form", clear_on_submit=False):
+        description = st.text_area(
+            "Describe the meeting, event, or task:",
+            placeholder=(
+                "Examples:\n"
+                "• Meeting: 'Schedule a sync with Alice (alice@co.com) and Bob (bob@co.com) on Friday at 2 PM for 1 hour'\n"
+                "• Event: 'Block my calendar for deep work on Monday from 9 AM to 12 PM'\n"
+                "• Task: 'Add a task to submit the Q1 report by end of this week'\n"
+                "• Birthday: 'Create Alice Smith\\'s birthday on June 15'\n"
+                "• Anniversary: 'Add John and Jane\\'s wedding anniversary on July 4'"
+            ),
+            height=160
+        )
 
-    description = st.text_area(
-        "Describe the meeting, event, or task:",
-        placeholder=(
-            "Examples:\n"
-            "• Meeting: 'Schedule a sync with Alice (alice@co.com) and Bob (bob@co.com) on Friday at 2 PM for 1 hour'\n"
-            "• Event: 'Block my calendar for deep work on Monday from 9 AM to 12 PM'\n"
-            "• Task: 'Add a task to submit the Q1 report by end of this week'\n"
-            "• Birthday: 'Create Alice Smith\\'s birthday on June 15'\n"
-            "• Anniversary: 'Add John and Jane\\'s wedding anniversary on July 4'"
-        ),
-        height=160
-    )
+        st.markdown("---")
+        reminders = render_notification_controls("create")
 
-    st.markdown("---")
-    reminders = render_notification_controls("create")
+        submitted = st.form_submit_button("🚀 Create", type="primary", width=BUTTON_WIDTH)
 
-    if st.button("🚀 Create", type="primary", use_container_width=True):
+    if submitted:
         if not description.strip():
             st.error("❌ Please enter a description.")
         else:
-            with st.spinner("Processing your request..."):
-                try:
-                    result = process_calendar_request(creds, "primary", description, reminders_override=reminders)
-                    if result and result.success:
-                        st.success("✅ Created successfully!")
-                        st.markdown(f"**Message:** {result.message}")
-                        if result.calendar_link:
-                            st.markdown(f"**Calendar Link:** [View Event]({result.calendar_link})")
-                    else:
-                        msg = result.message if result else "Could not process request. Please try a clearer description."
-                        st.error(f"❌ {msg}")
-                except Exception as e:
-                    st.error(f"❌ Error: {e}")
+            submit_request("create_request", process_calendar_request(creds, "primary", description, reminders_override=reminders))
+
+    request = finished_request("create_request", "Processing your request...")
+    if request is not None:
+        try:
+            result = request.result()
+            if result and result.success:
+                search_calendar_events.clear()
+                st.success("✅ Created successfully!")
+                st.markdown(f"**Message:** {result.message}")
+                if result.calendar_link:
+                    st.markdown(f"**Calendar Link:** [View Event]({result.calendar_link})")
+            else:
+                msg = result.message if result else "Could not process request. Please try a clearer description."
+                st.error(f"❌ {msg}")
+        except Exception as e:
+            st.error(f"❌ Error: {e}")
+
+
+def get_search_date_range(date_option, start_date=None, end_date=None):
+    """Return (timeMin, timeMax) RFC 3339 bounds, in local time, for a search date range."""
+    today = date.today()
+    if date_option == "Today":
+        first_day, last_day = today, today
+    elif date_option == "This Week":
+        first_day = today - timedelta(days=today.weekday())
+        last_day = first_day + timedelta(days=6)
+    elif date_option == "This Month":
+        first_day = today.replace(day=1)
+        last_day = (first_day + timedelta(days=32)).replace(day=1) - timedelta(days=1)
+    else:
+        first_day, last_day = start_date, end_date
 
+    time_min = datetime.combine(first_day, time.min).astimezone().isoformat() if first_day else None
+    time_max = datetime.combine(last_day + timedelta(days=1), time.min).astimezone().isoformat() if last_day else None
+    return time_min, time_max
 
+
+@st.cache_data(ttl=60, show_spinner=False)
+def search_calendar_events(query, time_min, time_max, _creds):
+    """Search calendar events, reusing results for identical searches within a minute."""
+    return run_async(
+        get_calendar_events(_creds, "primary", query or "all events", time_min=time_min, time_max=time_max)
+    ).result()
+
+
+@st.fragment
 def show_search_page(creds):
     """Page for searching calendar events and tasks."""
     st.markdown("## 🔍 Search Meetings, Events, and Tasks")
 
-    col1, col2 = st.columns(2)
-
-    with col1:
-        search_query = st.text_input(
-            "Search by description:",
-            placeholder="e.g., team meeting, dentist, report"
-        )
-
-    with col2:
-        date_option = st.selectbox(
-            "Date range (for calendar items):",
-            ["Today", "This Week", "This Month", "Custom Range"]
-        )
+    # The date range stays outside the form because choosing "Custom Range" has to
+    # rerun the page to show the date pickers.
+    date_option = st.selectbox(
+        "Date range (for calendar items):",
+        ["Today", "This Week", "This Month", "Custom Range"]
+    )
 
     if date_option == "Custom Range":
         col1, col2 = st.columns(2)
@@ -389,149 +588,185 @@ def show_search_page(creds):
         start_date = None
         end_date = None
 
-    include_tasks = st.checkbox("Also search tasks", value=True)
+    with st.form("search_form", clear_on_submit=False):
+        search_query = st.text_input(
+            "Search by description:",
+            placeholder="e.g., team meeting, dentist, report"
+        )
 
-    if st.button("🔍 Search", type="primary", use_container_width=True):
+        include_tasks = st.checkbox("Also search tasks", value=True)
+
+        submitted = st.form_submit_button("🔍 Search", type="primary", width=BUTTON_WIDTH)
+
+    if submitted:
         if not search_query and date_option == "Custom Range" and not start_date and not end_date:
             st.warning("⚠️ Please provide a search query or select a date range.")
         else:
-            with st.spinner("Searching..."):
+            events, tasks, failed = [], [], False
+            with st.status("Searching calendar...", expanded=False) as search_status:
                 # --- Calendar events (meetings + personal events) ---
                 try:
-                    events = get_calendar_events(creds, "primary", search_query or "all events")
+                    time_min, time_max = get_search_date_range(date_option, start_date, end_date)
+                    events = search_calendar_events(search_query, time_min, time_max, creds)
                 except Exception as e:
-                    events = []
+                    failed = True
                     st.error(f"❌ Error searching calendar: {e}")
 
-                if events:
-                    st.markdown(f"### 📅 Calendar Items ({len(events)} found)")
-                    for i, event in enumerate(events, 1):
-                        start = event["start"].get("dateTime", event["start"].get("date"))
-                        end = event["end"].get("dateTime", event["end"].get("date"))
-                        location = event.get("location", "No location")
-                        description = event.get("description", "No description")
-                        has_attendees = len(event.get("attendees", [])) > 0
-                        label = "Meeting" if has_attendees else "Event"
-
-                        with st.expander(f"{i}. {'👥' if has_attendees else '📅'} [{label}] {event.get('summary', 'No title')}"):
-                            st.markdown(f"**📅 Time:** {start} to {end}")
-                            st.markdown(f"**📍 Location:** {location}")
-                            st.markdown(f"**📝 Description:** {description}")
-                            if has_attendees:
-                                attendees = [a.get("email", "") for a in event.get("attendees", [])]
-                                st.markdown(f"**👥 Attendees:** {', '.join(attendees)}")
-                            if event.get("htmlLink"):
-                                st.markdown(f"**🔗 [View in Calendar]({event['htmlLink']})**")
-                elif not include_tasks:
-                    st.info("📭 No calendar items found matching your criteria.")
-
                 # --- Tasks ---
                 if include_tasks:
+                    search_status.update(label=f"Found {len(events)} calendar item(s). Searching tasks...")
                     try:
                         tasks = get_tasks(creds, search_query or "all tasks")
                     except Exception as e:
-                        tasks = []
+                        failed = True
                         st.error(f"❌ Error searching tasks: {e}")
 
-                    if tasks:
-                        st.markdown(f"### ✅ Tasks ({len(tasks)} found)")
-                        for i, task in enumerate(tasks, 1):
-                            due = task.get("due", "No due date")
-                            notes = task.get("notes", "No notes")
-                            status = task.get("status", "needsAction")
-                            status_icon = "✅" if status == "completed" else "⬜"
-                            with st.expander(f"{i}. {status_icon} {task.get('title', 'Untitled Task')}"):
-                                st.markdown(f"**📅 Due:** {due}")
-                                st.markdown(f"**📝 Notes:** {notes}")
-                                st.markdown(f"**Status:** {status}")
-                    elif not events:
-                        st.info("📭 No items found matching your criteria.")
-
-
+                summary = f"Found {len(events)} calendar item(s)"
+                if include_tasks:
+                    summary += f" and {len(tasks)} task(s)"
+                # Expand the status box on failure so the error inside it is visible
+                search_status.update(label=summary, state="error" if failed else "complete", expanded=failed)
+
+            if events:
+                st.markdown(f"### 📅 Calendar Items ({len(events)} found)")
+                for i, event in enumerate(events, 1):
+                    event_start, event_end = event["start"], event["end"]
+                    start = event_start.get("dateTime") or event_start.get("date")
+                    end = event_end.get("dateTime") or event_end.get("date")
+                    location = event.get("location", "No location")
+                    description = event.get("description", "No description")
+                    has_attendees = len(event.get("attendees", [])) > 0
+                    label = "Meeting" if has_attendees else "Event"
+
+                    with st.expander(f"{i}. {'👥' if has_attendees else '📅'} [{label}] {event.get('summary', 'No title')}"):
+                        st.markdown(f"**📅 Time:** {start} to {end}")
+                        st.markdown(f"**📍 Location:** {location}")
+                        st.markdown(f"**📝 Description:** {description}")
+                        if has_attendees:
+                            attendees = [a.get("email", "") for a in event.get("attendees", [])]
+                            st.markdown(f"**👥 Attendees:** {', '.join(attendees)}")
+                        if event.get("htmlLink"):
+                            st.markdown(f"**🔗 [View in Calendar]({event['htmlLink']})**")
+            elif not include_tasks:
+                st.info("📭 No calendar items found matching your criteria.")
+
+            if include_tasks:
+                if tasks:
+                    st.markdown(f"### ✅ Tasks ({len(tasks)} found)")
+                    for i, task in enumerate(tasks, 1):
+                        due = task.get("due", "No due date")
+                        notes = task.get("notes", "No notes")
+                        status = task.get("status", "needsAction")
+                        status_icon = "✅" if status == "completed" else "⬜"
+                        with st.expander(f"{i}. {status_icon} {task.get('title', 'Untitled Task')}"):
+                            st.markdown(f"**📅 Due:** {due}")
+                            st.markdown(f"**📝 Notes:** {notes}")
+                            st.markdown(f"**Status:** {status}")
+                elif not events:
+                    st.info("📭 No items found matching your criteria.")
+
+
+@st.fragment
 def show_modify_page(creds):
     """Page for modifying existing meetings, events, or tasks."""
     st.markdown("## ✏️ Modify Meeting, Event, or Task")
-    st.markdown(
-        "Describe the change you want to make. The agent will determine whether the item "
-        "is a **meeting**, **event**, or **task** and apply the update."
-    )
+    st.markdown(MODIFY_INTRO_MD)
+
+    with st.form("modify_form", clear_on_submit=False):
+        description = st.text_area(
+            "Describe what to modify:",
+            placeholder=(
+                "Examples:\n"
+                "• 'Move the Friday team meeting to 3 PM'\n"
+                "• 'Change my dentist appointment location to 123 Main St'\n"
+                "• 'Mark the report review task as completed'"
+            ),
+            height=120
+        )
 
-    description = st.text_area(
-        "Describe what to modify:",
-        placeholder=(
-            "Examples:\n"
-            "• 'Move the Friday team meeting to 3 PM'\n"
-            "• 'Change my dentist appointment location to 123 Main St'\n"
-            "• 'Mark the report review task as completed'"
-        ),
-        height=120
-    )
+        st.markdown("---")
+        reminders = render_notification_controls("modify")
 
-    st.markdown("---")
-    reminders = render_notification_controls("modify")
+        submitted = st.form_submit_button("✏️ Apply Modification", type="primary", width=BUTTON_WIDTH)
 
-    if st.button("✏️ Apply Modification", type="primary", use_container_width=True):
+    if submitted:
         if not description.strip():
             st.error("❌ Please enter a description.")
         else:
-            with st.spinner("Applying modification..."):
-                try:
-                    result = process_calendar_request(creds, "primary", description, reminders_override=reminders)
-                    if result and result.success:
-                        st.success("✅ Modified successfully!")
-                        st.markdown(f"**Message:** {result.message}")
-                    else:
-                        msg = result.message if result else "Could not process request."
-                        st.error(f"❌ {msg}")
-                except Exception as e:
-                    st.error(f"❌ Error: {e}")
-
+            submit_request("modify_request", process_calendar_request(creds, "primary", description, reminders_override=reminders))
 
+    request = finished_request("modify_request", "Applying modification...")
+    if request is not None:
+        try:
+            result = request.result()
+            if result and result.success:
+                search_calendar_events.clear()
+                st.success("✅ Modified successfully!")
+                st.markdown(f"**Message:** {result.message}")
+            else:
+                msg = result.message if result else "Could not process request."
+                st.error(f"❌ {msg}")
+        except Exception as e:
+            st.error(f"❌ Error: {e}")
+
+
+async def delete_matching_items(creds, description, delete_all):
+    """Delete the meetings, events, or tasks matching the description."""
+    # Classify item type to route to the right delete function
+    request_type = await classify_request(description)
+    item_type = request_type.item_type
+
+    if item_type == "task":
+        return await asyncio.to_thread(delete_task, creds, description, all=delete_all)
+    return await delete_event(creds, "primary", description, all=delete_all)
+
+
+@st.fragment
 def show_delete_page(creds):
     """Page for deleting meetings, events, or tasks."""
     st.markdown("## 🗑️ Delete Meeting, Event, or Task")
 
     st.warning("⚠️ **Warning:** This action cannot be undone!")
 
-    description = st.text_area(
-        "Describe what to delete:",
-        placeholder=(
-            "Examples:\n"
-            "• 'Delete the team meeting scheduled for tomorrow'\n"
-            "• 'Remove my dentist appointment on Friday'\n"
-            "• 'Delete the task to review the Q1 report'"
-        ),
-        height=120
-    )
+    with st.form("delete_form", clear_on_submit=False):
+        description = st.text_area(
+            "Describe what to delete:",
+            placeholder=(
+                "Examples:\n"
+                "• 'Delete the team meeting scheduled for tomorrow'\n"
+                "• 'Remove my dentist appointment on Friday'\n"
+                "• 'Delete the task to review the Q1 report'"
+            ),
+            height=120
+        )
+
+        delete_all = st.checkbox("Delete all matching items (if multiple found)")
 
-    delete_all = st.checkbox("Delete all matching items (if multiple found)")
+        submitted = st.form_submit_button("🗑️ Delete", type="primary", width=BUTTON_WIDTH)
 
-    if st.button("🗑️ Delete", type="primary", use_container_width=True):
+    if submitted:
         if not description.strip():
             st.error("❌ Please enter a description.")
         else:
-            with st.spinner("Finding and deleting..."):
-                try:
-                    # Classify item type to route to the right delete function
-                    request_type = determine_calendar_request_type(description)
-                    item_type = request_type.get("item_type", "unknown")
-
-                    if item_type == "task":
-                        result = delete_task(creds, description, all=delete_all)
-                    else:
-                        result = delete_event(creds, "primary", description, all=delete_all)
-
-                    if result and result.success:
-                        st.success("✅ Deleted successfully!")
-                        st.markdown(f"**Message:** {result.message}")
-                    else:
-                        msg = result.message if result else "Could not process request."
-                        st.error(f"❌ {msg}")
-                except Exception as e:
-                    st.error(f"❌ Error: {e}")
+            submit_request("delete_request", delete_matching_items(creds, description, delete_all))
 
-
-def show_settings_page():
+    request = finished_request("delete_request", "Finding and deleting...")
+    if request is not None:
+        try:
+            result = request.result()
+            if result and result.success:
+                search_calendar_events.clear()
+                st.success("✅ Deleted successfully!")
+                st.markdown(f"**Message:** {result.message}")
+            else:
+                msg = result.message if result else "Could not process request."
+                st.error(f"❌ {msg}")
+        except Exception as e:
+            st.error(f"❌ Error: {e}")
+
+
+@st.fragment
+def show_settings_page(creds):
     """Page for application settings."""
     st.markdown("## ⚙️ Settings")
 
@@ -541,14 +776,16 @@ def show_settings_page():
     st.markdown("### 📁 File Locations")
     col1, col2 = st.columns(2)
 
+    file_state = get_file_state()
+
     with col1:
         st.markdown("**Required files:**")
-        if os.path.exists("credentials.json"):
+        if file_state["credentials.json"]:
             st.success("✅ credentials.json")
         else:
             st.error("❌ credentials.json (missing)")
 
-        if os.path.exists("token.json"):
+        if file_state["token.json"]:
             st.success("✅ token.json")
         else:
             st.info("ℹ️ token.json (will be created on first use)")
@@ -562,12 +799,24 @@ def show_settings_page():
 
     st.markdown("### 🧹 Clear Data")
     if st.button("🗑️ Clear Authentication Token"):
-        if os.path.exists("token.json"):
-            os.remove("token.json")
+        if file_state["token.json"]:
+            discard_token()
+            clear_google_credentials()
             st.success("✅ Authentication token cleared. You'll need to re-authenticate.")
         else:
             st.info("ℹ️ No authentication token to clear.")
 
 
+# Page renderers for each sidebar entry; every renderer takes the Google credentials
+PAGE_ROUTES = {
+    "🏠 Home": show_home_page,
+    "➕ Create": show_create_page,
+    "🔍 Search": show_search_page,
+    "✏️ Modify": show_modify_page,
+    "🗑️ Delete": show_delete_page,
+    "⚙️ Settings": show_settings_page,
+}
+
+
 if __name__ == "__main__":
     main()
@@ -1,8 +1,15 @@
 # Agentic workflow to manage Google calendar meetings, events, and tasks
 
 import os
+import re
 import json
+import asyncio
 import logging
+import orjson
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from time import monotonic
 
 from dotenv import load_dotenv
 load_dotenv()
@@ -12,12 +19,15 @@ from google.genai import types
 from google.genai.types import Tool
 from pydantic import BaseModel, Field, ConfigDict
 from typing import Optional, Literal
-from datetime import datetime, timezone, date as date_type
+from datetime import datetime, timezone, time, date as date_type
 
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
+from googleapiclient.model import JsonModel
 from googleapiclient.errors import HttpError
 
 # If modifying these scopes, delete the file token.json.
@@ -26,9 +36,9 @@ SCOPES = [
     "https://www.googleapis.com/auth/tasks",
 ]
 
-# Set up logging configuration
+# Set up logging configuration; LOG_LEVEL (e.g. WARNING) quiets the per-request logs
 logging.basicConfig(
-    level=logging.INFO,
+    level=os.environ.get("LOG_LEVEL", "INFO").upper(),
     format="%(asctime)s - %(levelname)s - %(message)s",
     datefmt="%Y-%m-%d %H:%M:%S",
 )
@@ -36,6 +46,31 @@ logger = logging.getLogger(__name__)
 
 client = genai.Client(api_key=os.environ["GOOGLE_API_KEY"])
 model_name = os.environ.get("LLM_MODEL_NAME", "gemini-2.5-flash")
+# Classification is a small fixed-choice task, so it runs on a lighter, faster model
+classifier_model_name = os.environ.get("CALENDAR_CLASSIFIER_MODEL", "gemini-2.5-flash-lite")
+
+# Maximum number of calls the Google Calendar API accepts in one batch request
+BATCH_SIZE = 50
+
+# Maximum number of single-event deletes in flight when batch requests are unavailable
+DELETE_CONCURRENCY = 10
+
+# Partial-response mask for events().list: only the event fields the handlers and UI read
+EVENT_LIST_FIELDS = (
+    "items(id,summary,description,location,start,end,recurrence,attendees(email),reminders,htmlLink),"
+    "nextPageToken"
+)
+
+# Number of classification / list-parameter responses to keep per in-process cache
+RESPONSE_CACHE_SIZE = 512
+
+# Size and lifetime (seconds) of the cache of events matching a description
+MATCHING_EVENTS_CACHE_SIZE = 64
+MATCHING_EVENTS_TTL = 60
+
+# Size and lifetime (seconds) of the cache of calendar default time zones
+TIME_ZONE_CACHE_SIZE = 64
+TIME_ZONE_TTL = 3600
 
 # --------------------------------------------------------------
 # Step 1: Define the data models for each stage
@@ -69,17 +104,11 @@ class EventDateTime(BaseModel):
         ),
     )
 
-class CalendarEvent(BaseModel):
-    """Determine whether the request describes a calendar meeting, event, or task."""
-    description: str = Field(description="Text describing the request")
+class CalendarClassification(BaseModel):
+    """Decide whether the request is a calendar/task request and classify its action and item type."""
     is_calendar_event: bool = Field(
         description="True if this is a calendar meeting, event, or task request"
     )
-    confidence_score: float = Field(description="Confidence score between 0 and 1")
-
-class CalendarRequestType(BaseModel):
-    """Classify the action and item type of a calendar/task request."""
-    description: str = Field(description="Text describing the request, stripped of action keywords")
     action: Literal["new", "modify", "delete", "other"] = Field(
         description="Action to take: new (create), modify (update), delete (remove), or other"
     )
@@ -93,6 +122,7 @@ class CalendarRequestType(BaseModel):
             "'anniversary' = a yearly recurring all-day anniversary event (e.g. wedding, work, or other milestone)"
         )
     )
+    description: str = Field(description="Text describing the request, stripped of action keywords")
     confidence_score: float = Field(description="Confidence score between 0 and 1")
 
 class ReminderOverride(BaseModel):
@@ -137,28 +167,42 @@ class NewEventDetails(BaseModel):
         )
     )
 
-# TODO: Determine if this data model is needed
 class ModifyEventDetails(BaseModel):
-    """Details for modifying an existing calendar event"""
+    """Fields to change on an existing calendar event; fields left unset are not modified"""
     summary: Optional[str] = Field(default=None, description="Summary of the event")
-    location: Optional[str] = Field(description="Location of the event")
-    description: Optional[str] = Field(description="Description of the event")
-    start: Optional[EventDateTime] = Field(description="Start time object with fields dateTime and timeZone")
+    location: Optional[str] = Field(default=None, description="Location of the event")
+    description: Optional[str] = Field(default=None, description="Description of the event")
+    start: Optional[EventDateTime] = Field(default=None, description="Start time object with fields dateTime and timeZone")
     end: Optional[EventDateTime] = Field(default=None, description="End time object with fields dateTime and timeZone")
-    recurrence: Optional[list[str]] = Field(default=[], description="Recurrence rules")
+    recurrence: Optional[list[str]] = Field(default=None, description="Recurrence rules")
     attendees: Optional[list[EmailAddress]] = Field(
-        description="List of attendee objects with fields email"
+        default=None, description="List of attendee objects with fields email"
+    )
+    reminders: Optional[EventReminders] = Field(
+        default=None,
+        description="Notification settings. Populate only when the user requests a notification change."
     )
 
 class EventsListParameters(BaseModel):
     """Parameters for listing calendar events"""
     calendarId: str = Field(description="Calendar ID")
-    timeMin: Optional[str] = Field(default=None, description="Start time in RFC3339 format (e.g. '2026-03-29T00:00:00Z')")
-    timeMax: Optional[str] = Field(default=None, description="End time in RFC3339 format (e.g. '2026-03-29T23:59:59Z')")
+    timeMin: Optional[str] = Field(default=None, description="Start time in RFC3339 format with the local UTC offset (e.g. '2026-03-29T00:00:00-07:00')")
+    timeMax: Optional[str] = Field(default=None, description="End time in RFC3339 format with the local UTC offset (e.g. '2026-03-29T23:59:59-07:00')")
     singleEvents: bool = Field(default=False, description="Whether to return single events")
     orderBy: Optional[str] = Field(default=None, description="Order by")
     q: Optional[str] = Field(default=None, description="Query")
 
+class ModifyPlan(BaseModel):
+    """How to find the event referenced in a modify request, and what to change on it."""
+    query: EventsListParameters = Field(description="Parameters for listing the event to modify")
+    patch: ModifyEventDetails = Field(description="Only the fields being changed")
+    confidence_score: float = Field(
+        description=(
+            "Confidence between 0 and 1 that the patch is complete without seeing the current event. "
+            "Low when the change is relative to the event's current values (e.g. 'an hour later')."
+        )
+    )
+
 class AnnualEventDetails(BaseModel):
     """Extracted details from a birthday or anniversary event request."""
     summary: str = Field(description=(
@@ -212,9 +256,162 @@ def _is_in_past(dt_str: str) -> bool:
         return False
 
 
-# Invoke the GenAI (Gemini) model and return its response
-def run_model(model_name, contents, config):
-    response = client.models.generate_content(
+class OrjsonModel(JsonModel):
+    """googleapiclient JSON model that encodes request bodies and decodes responses with orjson."""
+
+    def serialize(self, body_value):
+        if isinstance(body_value, dict) and "data" not in body_value and self._data_wrapper:
+            body_value = {"data": body_value}
+        return orjson.dumps(body_value).decode("utf-8")
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Same as JsonModel: hand back non-JSON payloads as text
+            return content.decode("utf-8") if isinstance(content, bytes) else content
+        if self._data_wrapper and "data" in body:
+            body = body["data"]
+        return body
+
+
+@lru_cache(maxsize=32)
+def _get_http(credentials, thread_id: int) -> AuthorizedHttp:
+    # One authorized keep-alive transport per thread, shared by the Calendar and Tasks clients
+    # build_http applies the library's default timeout and 308 handling, as build() would
+    return AuthorizedHttp(credentials, http=build_http())
+
+
+@lru_cache(maxsize=64)
+def _build_service(api_name: str, api_version: str, credentials, thread_id: int):
+    return build(
+        api_name, api_version,
+        http=_get_http(credentials, thread_id),
+        model=OrjsonModel(),
+        cache_discovery=False,
+        static_discovery=True,
+    )
+
+
+def get_service(api_name: str, api_version: str, credentials):
+    """Return an API client built once per credentials object and thread.
+
+    Keyed on the credentials object itself (hashed by identity), which also keeps it
+    alive so a recycled id() can never return another account's client. Clients on the
+    same thread share one AuthorizedHttp, so Calendar and Tasks calls reuse the same
+    connections to googleapis.com. httplib2 is not thread-safe, so each thread gets its
+    own transport; the UI calls in from both the script thread and its event-loop thread.
+    The bundled discovery document is used, so building never fetches it over the network.
+    """
+    return _build_service(api_name, api_version, credentials, threading.get_ident())
+
+
+def _execute_request(api_name: str, api_version: str, credentials, build_request):
+    """Build a request with this thread's client and execute it; run via asyncio.to_thread.
+
+    Blocking API calls stay off the event loop, which the UI shares between sessions, and
+    the request is built on the same thread (and transport) that executes it.
+    """
+    service = get_service(api_name, api_version, credentials)
+    return build_request(service).execute()
+
+
+def get_calendar_time_zone(credentials, calendar_id) -> Optional[str]:
+    """Return the calendar's default IANA time zone, or None if it cannot be fetched."""
+    try:
+        service = get_service("calendar", "v3", credentials)
+        calendar = service.calendars().get(calendarId=calendar_id, fields="timeZone").execute()
+        return calendar.get("timeZone")
+    except HttpError as error:
+        logger.error("An error occurred fetching the calendar time zone: %s", error)
+        return None
+
+
+def _time_zone_rule(time_zone: Optional[str]) -> str:
+    """Prompt line pinning timeZone to the calendar's own zone, when it is known."""
+    if not time_zone:
+        return ""
+    return f'The calendar\'s time zone is "{time_zone}"; use it for timeZone unless the description names another.'
+
+
+def _event_start(event: dict) -> Optional[str]:
+    """Return an event's start dateTime, or its date for all-day events."""
+    start = event.get("start", {})
+    return start.get("dateTime") or start.get("date")
+
+
+class ResponseCache:
+    """Small LRU cache for side-effect-free results (classification, list parameters, matching events).
+
+    functools.lru_cache would cache the coroutine object rather than its result, so
+    the async callers look results up and store them explicitly. With a ttl, entries
+    expire that many seconds after being stored.
+    """
+
+    def __init__(self, maxsize: int = RESPONSE_CACHE_SIZE, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items = OrderedDict()
+
+    def get(self, key):
+        if key not in self._items:
+            return None
+        expires, value = self._items[key]
+        if expires is not None and monotonic() >= expires:
+            del self._items[key]
+            return None
+        self._items.move_to_end(key)
+        return value
+
+    def put(self, key, value):
+        expires = monotonic() + self.ttl if self.ttl is not None else None
+        self._items[key] = (expires, value)
+        self._items.move_to_end(key)
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+
+    def clear(self):
+        self._items.clear()
+
+
+def _normalize(text: str) -> str:
+    """Cache key for user text: case-folded with whitespace collapsed."""
+    return " ".join(text.lower().split())
+
+
+_classification_cache = ResponseCache()
+_list_parameters_cache = ResponseCache()
+# Cleared whenever this module creates, modifies, or deletes an event
+_matching_events_cache = ResponseCache(MATCHING_EVENTS_CACHE_SIZE, ttl=MATCHING_EVENTS_TTL)
+# Calendar default time zones by (credentials, calendar_id); the ttl picks up a changed zone
+_time_zone_cache = ResponseCache(TIME_ZONE_CACHE_SIZE, ttl=TIME_ZONE_TTL)
+
+
+@lru_cache(maxsize=1)
+def _today_context(date_ordinal: int) -> str:
+    """Prompt sentence naming today's date; keyed on the ordinal, so it rolls over at midnight."""
+    today = date_type.fromordinal(date_ordinal)
+    return f"Today is {today.strftime('%A, %B %d, %Y')}."
+
+def _user_contents(text: str) -> list:
+    """Wrap the user's text as the single-turn contents of a model request."""
+    return [types.Content(role="user", parts=[types.Part(text=text)])]
+
+async def warm_up_model_client():
+    """Open the async client's connection to the Gemini API before the first real request.
+
+    Lists a single model so DNS, TCP, and TLS setup happen while the caller is still
+    busy with other startup work. Failures are only logged; the first request retries.
+    """
+    try:
+        await client.aio.models.list(config=types.ListModelsConfig(page_size=1))
+        logger.info("Gemini client connection warmed up")
+    except Exception as error:
+        logger.warning("Could not warm up the Gemini client: %s", error)
+
+# Invoke the GenAI (Gemini) model asynchronously and return its response
+async def arun_model(model_name, contents, config):
+    response = await client.aio.models.generate_content(
         model=model_name,
         contents=contents,
         config=config
@@ -228,161 +425,283 @@ def parse_json_response(response) -> dict:
         text = text.split("\n", 1)[-1]  # drop the opening ```json line
         text = text.rsplit("```", 1)[0]  # drop the closing ```
     text = text.strip()
-    obj, _ = json.JSONDecoder().raw_decode(text)
-    return obj
+    try:
+        return orjson.loads(text)
+    except orjson.JSONDecodeError:
+        # Trailing text after the JSON object: decode just the leading value
+        obj, _ = json.JSONDecoder().raw_decode(text)
+        return obj
+
+def parse_response(response, schema: type[BaseModel]) -> BaseModel:
+    """Return the schema instance the SDK parsed from the response.
+
+    response.parsed is None when the SDK could not parse the text itself (e.g. it was
+    wrapped in a code fence); fall back to parse_json_response and validate that.
+    """
+    parsed = response.parsed
+    if parsed is None:
+        parsed = schema.model_validate(parse_json_response(response))
+    return parsed
+
+def to_api_body(details: BaseModel) -> dict:
+    """Dump model output as a Google API request body, keeping only the fields the model set."""
+    return details.model_dump(mode="json", exclude_unset=True, exclude_none=True)
 
 # --------------------------------------------------------------
 # Step 2: Define the functions to process calendar/task requests
 # --------------------------------------------------------------
 
-# Check if the user's description is a calendar meeting, event, or task
-def check_if_calendar_event(description: str) -> CalendarEvent:
-    """Check if the description is a calendar meeting, event, or task request."""
-    logger.info("Checking if the description is a calendar/task request")
-    logger.debug(f"Input text: {description}")
+# Keyword pre-classifier, for new items only. Modify and delete requests always go to the
+# model, since a keyword guess there edits or removes an existing event. "add" is left out
+# of NEW_RE on purpose: "add Bob to the review" is a modification.
+NEW_RE = re.compile(r"\b(schedule|create|book|set up|plan)\b", re.I)
+MODIFY_RE = re.compile(r"\b(reschedule|move|change|update|modify|edit|rename|postpone|push back)\b", re.I)
+DELETE_RE = re.compile(r"\b(delete|cancel|remove)\b", re.I)
+TASK_RE = re.compile(r"\b(tasks?|to-?dos?)\b", re.I)
+BIRTHDAY_RE = re.compile(r"\bbirthdays?\b", re.I)
+ANNIVERSARY_RE = re.compile(r"\banniversar(y|ies)\b", re.I)
+EMAIL_RE = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+WITH_RE = re.compile(r"\bwith\b", re.I)
+# Whole-word day names and clock times: evidence that a "new" request is a calendar entry
+# rather than e.g. "create a slide deck". Abbreviations that are also words (sat, sun) are left out.
+CALENDAR_HINT_RE = re.compile(
+    r"\b(monday|tuesday|wednesday|thursday|friday|saturday|sunday|"
+    r"mon|tue|tues|wed|thu|thur|thurs|fri|today|tomorrow|tonight|noon|midnight)\b"
+    r"|\b\d{1,2}(:\d{2})?\s*(am|pm)\b|\b\d{1,2}:\d{2}\b",
+    re.I
+)
 
-    config = types.GenerateContentConfig(
-        system_instruction="""You are a calendar and task manager.
-        Determine if the incoming request is for a calendar meeting, calendar event, or task.
-        - A meeting is a calendar event that involves inviting at least one other person.
-        - An event is a personal calendar entry (appointment, reminder, block time) with no external attendees.
-        - A task is a to-do item that may or may not have a due date but does not occupy a calendar time slot.
-        Return True for is_calendar_event if the request is for any of these three types.
-        Return a confidence score between 0 and 1.
-        """,
-        response_mime_type="application/json",
-        response_schema=CalendarEvent
-    )
 
-    contents = [
-        types.Content(role="user", parts=[types.Part(text=description)])
-    ]
+def _classify_by_keywords(description: str) -> Optional[CalendarClassification]:
+    """Classify obvious new-item requests without a model call; return None otherwise.
 
-    response = run_model(model_name, contents, config)
-    response_json = parse_json_response(response)
+    Only requests that use a create verb, no modify/delete verb, and name a day, a time,
+    or an attendee email are classified here; everything else goes to the model. The
+    description is passed on unchanged, since every create handler extracts its own fields.
+    """
+    if not NEW_RE.search(description) or MODIFY_RE.search(description) or DELETE_RE.search(description):
+        return None
+    has_email = EMAIL_RE.search(description) is not None
+    if not has_email and not CALENDAR_HINT_RE.search(description):
+        return None
 
-    logger.info(
-        f"Extraction complete - Is calendar/task request: {response_json['is_calendar_event']}, "
-        f"Confidence: {response_json['confidence_score']:.2f}"
+    if TASK_RE.search(description):
+        item_type = "task"
+    elif BIRTHDAY_RE.search(description):
+        item_type = "birthday"
+    elif ANNIVERSARY_RE.search(description):
+        item_type = "anniversary"
+    elif has_email:
+        item_type = "meeting"
+    elif not WITH_RE.search(description):
+        item_type = "event"
+    else:
+        # Attendees named but not emailed: let the model decide between meeting and event
+        return None
+
+    return CalendarClassification(
+        is_calendar_event=True,
+        action="new",
+        item_type=item_type,
+        description=description,
+        confidence_score=1.0,
     )
 
-    return response_json
 
+# The classification prompt does not depend on the request, so its config is built once
+CLASSIFY_CONFIG = types.GenerateContentConfig(
+    system_instruction="""You are a calendar and task manager.
+    Given the user's request, determine:
+    1. Whether it is a request for a calendar meeting, calendar event, or task at all.
+       Return True for is_calendar_event if it is any of these types.
+    2. The ACTION: new (create something), modify (update something), delete (remove something), or other.
+    3. The ITEM TYPE:
+       - 'meeting': a calendar event where at least one other person is invited (emails or names of attendees are mentioned)
+       - 'event': a personal calendar entry owned only by the calendar owner with no external attendees
+         (e.g., a doctor's appointment, gym session, focus block, reminder with a time)
+       - 'task': a to-do item managed via Google Tasks — no specific calendar time slot is required
+         (e.g., "remind me to buy groceries", "add a task to submit the report")
+       - 'birthday': a yearly recurring all-day birthday event for a specific person
+         (e.g., "Create Alice's birthday on June 15", "Add John's birthday on March 3rd")
+       - 'anniversary': a yearly recurring all-day anniversary event for a person or couple
+         (e.g., "Add our wedding anniversary on July 4", "Create John and Jane's work anniversary on May 1")
+    Also extract the cleaned description of the item, removing action keywords like "create", "schedule",
+    "add", "delete", "modify", "update", "change".
+    Return is_calendar_event, the action, item_type, cleaned description, and a confidence score between 0 and 1.
+    """,
+    response_mime_type="application/json",
+    response_schema=CalendarClassification
+)
 
-# Classify the action and item type of the request
-def determine_calendar_request_type(description: str) -> CalendarRequestType:
-    """Classify the action (new/modify/delete) and item type (meeting/event/task)."""
-    logger.info("Determining the type of calendar/task request")
-    logger.debug(f"Input text: {description}")
 
-    config = types.GenerateContentConfig(
-        system_instruction="""You are a calendar and task manager.
-        Given the user's request, determine:
-        1. The ACTION: new (create something), modify (update something), delete (remove something), or other.
-        2. The ITEM TYPE:
-           - 'meeting': a calendar event where at least one other person is invited (emails or names of attendees are mentioned)
-           - 'event': a personal calendar entry owned only by the calendar owner with no external attendees
-             (e.g., a doctor's appointment, gym session, focus block, reminder with a time)
-           - 'task': a to-do item managed via Google Tasks — no specific calendar time slot is required
-             (e.g., "remind me to buy groceries", "add a task to submit the report")
-           - 'birthday': a yearly recurring all-day birthday event for a specific person
-             (e.g., "Create Alice's birthday on June 15", "Add John's birthday on March 3rd")
-           - 'anniversary': a yearly recurring all-day anniversary event for a person or couple
-             (e.g., "Add our wedding anniversary on July 4", "Create John and Jane's work anniversary on May 1")
-        Also extract the cleaned description of the item, removing action keywords like "create", "schedule",
-        "add", "delete", "modify", "update", "change".
-        Return the action, item_type, cleaned description, and a confidence score between 0 and 1.
-        """,
-        response_mime_type="application/json",
-        response_schema=CalendarRequestType
-    )
+# Check if the user's description is a calendar request and classify it in one call
+async def classify_request(description: str) -> CalendarClassification:
+    """Check if the description is a calendar/task request and classify its action and item type."""
+    logger.info("Classifying the calendar/task request")
+    logger.debug("Input text: %s", description)
+
+    cache_key = _normalize(description)
+    cached = _classification_cache.get(cache_key)
+    if cached is not None:
+        logger.info("Classification served from cache")
+        return cached
 
-    contents = [
-        types.Content(role="user", parts=[types.Part(text=description)])
-    ]
+    classification = _classify_by_keywords(description)
+    if classification is not None:
+        logger.info("Classified by keywords - Action: %s, Item type: %s", classification.action, classification.item_type)
+        return classification
 
-    response = run_model(model_name, contents, config)
-    response_json = parse_json_response(response)
+    contents = _user_contents(description)
+
+    response = await arun_model(classifier_model_name, contents, CLASSIFY_CONFIG)
+    classification = parse_response(response, CalendarClassification)
 
     logger.info(
-        f"Extraction complete - Action: {response_json['action']}, "
-        f"Item type: {response_json['item_type']}, "
-        f"Confidence: {response_json['confidence_score']:.2f}"
+        "Extraction complete - Is calendar/task request: %s, Action: %s, Item type: %s, Confidence: %.2f",
+        classification.is_calendar_event,
+        classification.action,
+        classification.item_type,
+        classification.confidence_score
     )
 
-    return response_json
+    _classification_cache.put(cache_key, classification)
+    return classification
 
 
 # Get a list of calendar events given the user's description
-def get_calendar_events(credentials, calendar_id, description: str) -> list:
-    """Get a list of calendar events (meetings or personal events)."""
+async def get_calendar_events(credentials, calendar_id, description: str, time_min: Optional[str] = None, time_max: Optional[str] = None, max_results: Optional[int] = None) -> list:
+    """Get a list of calendar events (meetings or personal events).
+
+    time_min and time_max (RFC 3339) take precedence over any range extracted from the description.
+    max_results caps the number of events returned.
+    """
+    _, events = await fetch_matching_events(
+        credentials, calendar_id, description,
+        time_min=time_min, time_max=time_max, max_results=max_results
+    )
+    return events
+
+
+async def fetch_matching_events(credentials, calendar_id, description: str, time_min: Optional[str] = None, time_max: Optional[str] = None, max_results: Optional[int] = None) -> tuple[EventsListParameters, list]:
+    """Extract list parameters from the description and fetch the matching events.
+
+    Returns (params, events), with at most max_results events. A complete result (every page) is reused
+    for MATCHING_EVENTS_TTL seconds whatever max_results is, so a follow-up request about the
+    same events ("delete it" after "show me") skips both the model call and the Calendar call.
+    """
     logger.info("Getting a list of calendar events")
-    logger.debug(f"Input text: {description}")
+    logger.debug("Input text: %s", description)
+
+    now = datetime.now(timezone.utc).astimezone()  # aware, in the local time zone
+    date_context = _today_context(now.toordinal())
+
+    events_key = (credentials, calendar_id, _normalize(description), time_min, time_max)
+    cached = _matching_events_cache.get(events_key)
+    if cached is not None:
+        logger.info("Matching events served from cache")
+        params, events = cached
+        return params, events[:max_results]
+
+    # Relative dates in the description ("tomorrow", "next week") resolve differently each day
+    cache_key = (_normalize(description), now.date(), now.utcoffset())
+    params = _list_parameters_cache.get(cache_key)
+    if params is None:
+        params = await _extract_list_parameters(description, now, date_context)
+        _list_parameters_cache.put(cache_key, params)
+    logger.info("Events List Parameters: %s", params)
+
+    # Fetched with the full mask, so a cached result can serve every caller
+    events = await asyncio.to_thread(
+        list_events, credentials, params,
+        time_min=time_min, time_max=time_max, max_results=max_results
+    )
+    # An empty list may also mean the request failed, and a result cut at max_results may
+    # be missing matches, so only complete, non-empty results are kept
+    if events and (max_results is None or len(events) < max_results):
+        _matching_events_cache.put(events_key, (params, events))
+    return params, events
+
 
-    today = datetime.now()
-    date_context = f"Today is {today.strftime('%A, %B %d, %Y')}."
+def list_events(credentials, params: EventsListParameters, time_min: Optional[str] = None, time_max: Optional[str] = None, max_results: Optional[int] = None, fields: str = EVENT_LIST_FIELDS) -> list:
+    """Run events().list with model-extracted parameters; time_min/time_max take precedence.
 
+    Without either a time_min or an extracted timeMin, the search starts at local midnight today.
+    Pages are followed until max_results events are found, or through the last page without
+    max_results, since the API may return a short (even empty) page while matches remain;
+    fields must keep nextPageToken.
+    """
+    # Default search start: local midnight today, with its real UTC offset rather than a "Z" suffix
+    start_of_today = datetime.combine(date_type.today(), time.min).astimezone().isoformat()
+
+    try:
+        service = get_service("calendar", "v3", credentials)
+        events = []
+        page_token = None
+        while True:
+            events_result = service.events().list(
+                calendarId=params.calendarId,
+                timeMin=time_min or params.timeMin or start_of_today,
+                timeMax=time_max or params.timeMax,
+                singleEvents=params.singleEvents,
+                orderBy=params.orderBy,
+                q=params.q,
+                maxResults=max_results and max_results - len(events),
+                pageToken=page_token,
+                fields=fields
+            ).execute()
+            events.extend(events_result.get("items", []))
+            page_token = events_result.get("nextPageToken")
+            if not page_token or (max_results is not None and len(events) >= max_results):
+                break
+        logger.info("Found %s event(s)", len(events))
+    except HttpError as error:
+        logger.error("An error occurred: %s", error)
+        return []
+
+    return events
+
+
+def _list_parameters_rules(now: datetime) -> str:
+    """Prompt rules for the events().list parameters, shared by listing and modify planning."""
+    return f"""The current local time is {now.isoformat(timespec='seconds')}. Express timeMin and timeMax with this same
+        UTC offset; never append "Z" to a local time.
+        Only populate timeMin if the description specifies a start date.
+        Do not create a default timeMax. Only populate timeMax if the description specifies an end date.
+        The q field should contain the text from the description that would be in the summary of the Google calendar event."""
+
+
+async def _extract_list_parameters(description: str, now: datetime, date_context: str) -> EventsListParameters:
+    """Ask the model for the events().list parameters referenced in the description."""
     config = types.GenerateContentConfig(
         system_instruction=f"""You are an expert Google calendar manager.
         Given the {date_context} build a JSON object to fetch the Google calendar events referenced in the description.
-        If no start date is specified then use today at 12:00 AM as timeMin.
-        Do not create a default timeMax. Only populate timeMax if the description specifies an end date.
-        The q field should contain the text from the description that would be in the summary of the Google calendar event.
-        Return ONLY the relevant fields from the following list in JSON format:
-        - calendarId: string
-        - timeMin: datetime
-        - timeMax: datetime
-        - singleEvents: bool
-        - orderBy: string
-        - q: string
-        Do not include any other fields or properties.
+        {_list_parameters_rules(now)}
         """,
         response_mime_type="application/json",
         response_schema=EventsListParameters
     )
 
-    contents = [
-        types.Content(role="user", parts=[types.Part(text=description)])
-    ]
-
-    response = run_model(model_name, contents, config)
-    response_json = parse_json_response(response)
-    logger.info(f"Events List Parameters: {response_json}")
-
-    try:
-        service = build("calendar", "v3", credentials=credentials)
-        events_result = service.events().list(
-            calendarId=response_json["calendarId"],
-            timeMin=response_json.get("timeMin"),
-            timeMax=response_json.get("timeMax"),
-            singleEvents=response_json.get("singleEvents", False),
-            orderBy=response_json.get("orderBy"),
-            q=response_json.get("q")
-        ).execute()
-        events = events_result.get("items", [])
-        logger.info(f"Found {len(events)} event(s)")
-    except HttpError as error:
-        logger.error(f"An error occurred: {error}")
-        return []
+    contents = _user_contents(description)
 
-    return events
+    response = await arun_model(model_name, contents, config)
+    return parse_response(response, EventsListParameters)
 
 
 # Get a list of Google Tasks matching the description
 def get_tasks(credentials, description: str) -> list:
     """Get a list of Google Tasks from the default task list."""
     logger.info("Getting a list of Google Tasks")
-    logger.debug(f"Input text: {description}")
+    logger.debug("Input text: %s", description)
 
     try:
-        service = build("tasks", "v1", credentials=credentials)
+        service = get_service("tasks", "v1", credentials)
         tasks_result = service.tasks().list(
             tasklist="@default",
             showCompleted=False,
             showDeleted=False
         ).execute()
         tasks = tasks_result.get("items", [])
-        logger.info(f"Found {len(tasks)} task(s) total")
+        logger.info("Found %s task(s) total", len(tasks))
 
         # Filter by description if it's not a generic "all tasks" request
         if description and description.lower() not in ("all tasks", "all", ""):
@@ -391,24 +710,18 @@ def get_tasks(credentials, description: str) -> list:
                 if description.lower() in t.get("title", "").lower()
                 or description.lower() in t.get("notes", "").lower()
             ]
-            logger.info(f"Filtered to {len(filtered)} task(s) matching '{description}'")
+            logger.info("Filtered to %s task(s) matching '%s'", len(filtered), description)
             return filtered
 
         return tasks
     except HttpError as error:
-        logger.error(f"An error occurred fetching tasks: {error}")
+        logger.error("An error occurred fetching tasks: %s", error)
         return []
 
 
-# Create a new calendar meeting or personal event
-def create_new_event(credentials, calendar_id, description: str, item_type: str = "event", reminders_override: Optional[dict] = None) -> CalendarResponse:
-    """Create a new calendar meeting (with attendees) or personal event (no attendees)."""
-    logger.info(f"Creating a new calendar {item_type}")
-    logger.debug(f"Input text: {description}")
-
-    today = datetime.now()
-    date_context = f"Today is {today.strftime('%A, %B %d, %Y')}."
-
+@lru_cache(maxsize=8)
+def _create_event_config(date_context: str, item_type: str, time_zone: Optional[str]) -> types.GenerateContentConfig:
+    """Build the create-event config; reused while the date, item type, and calendar time zone are unchanged."""
     if item_type == "meeting":
         attendee_instruction = (
             "This is a MEETING — populate the attendees list with all people mentioned in the description. "
@@ -419,7 +732,7 @@ def create_new_event(credentials, calendar_id, description: str, item_type: str
             "This is a personal EVENT — the attendees list must be empty ([])."
         )
 
-    config = types.GenerateContentConfig(
+    return types.GenerateContentConfig(
         system_instruction=f"""You are a calendar event manager.
         Given the {date_context} create a new calendar entry based on the description.
         {attendee_instruction}
@@ -430,35 +743,41 @@ def create_new_event(credentials, calendar_id, description: str, item_type: str
         - NEVER append "Z" or any UTC offset (e.g. "+00:00", "-07:00") to dateTime. The timeZone field
           tells the Google Calendar API how to interpret the local time. Adding "Z" overrides timeZone
           and will place the event at the wrong time.
+        {_time_zone_rule(time_zone)}
 
-        Return ONLY these exact fields in JSON format:
-        - summary: string
-        - location: string
-        - description: string
-        - start: object with dateTime (local, no Z) and timeZone (IANA name)
-        - end: object with dateTime (local, no Z) and timeZone (IANA name)
-        - recurrence: array of strings
-        - attendees: array of objects with email field
-        - reminders: object with useDefault (bool) and overrides (array of objects with method and minutes).
-          Only populate reminders if the user explicitly requests notifications; otherwise omit it.
-          Example: {{"useDefault": false, "overrides": [{{"method": "email", "minutes": 1440}}, {{"method": "popup", "minutes": 30}}]}}
-        Do not include any other fields or properties.
+        Only populate reminders if the user explicitly requests notifications; otherwise omit it.
         """,
         response_mime_type="application/json",
         response_schema=NewEventDetails
     )
 
-    contents = [
-        types.Content(role="user", parts=[types.Part(text=description)])
-    ]
 
-    response = run_model(model_name, contents, config)
-    response_json = parse_json_response(response)
+# Create a new calendar meeting or personal event
+async def create_new_event(credentials, calendar_id, description: str, item_type: str = "event", reminders_override: Optional[dict] = None, time_zone: Optional[str] = None) -> CalendarResponse:
+    """Create a new calendar meeting (with attendees) or personal event (no attendees).
+
+    time_zone is the calendar's default time zone, if already known.
+    """
+    logger.info("Creating a new calendar %s", item_type)
+    logger.debug("Input text: %s", description)
+
+    date_context = _today_context(date_type.today().toordinal())
+
+    config = _create_event_config(date_context, item_type, time_zone)
+
+    contents = _user_contents(description)
+
+    response = await arun_model(model_name, contents, config)
+    details = parse_response(response, NewEventDetails)
+    event_body = to_api_body(details)
+    if time_zone:
+        for field in ("start", "end"):
+            event_body[field].setdefault("timeZone", time_zone)
 
     # Reject events scheduled in the past
-    start_dt = response_json.get("start", {}).get("dateTime") or response_json.get("start", {}).get("date")
+    start_dt = details.start.dateTime
     if start_dt and _is_in_past(start_dt):
-        logger.warning(f"Refused to create past {item_type}: start={start_dt}")
+        logger.warning("Refused to create past %s: start=%s", item_type, start_dt)
         return CalendarResponse(
             success=False,
             message=f"Cannot create a {item_type} in the past (start: {start_dt}). Please provide a future date and time.",
@@ -467,94 +786,90 @@ def create_new_event(credentials, calendar_id, description: str, item_type: str
 
     # UI-supplied reminders take precedence over LLM-extracted reminders
     if reminders_override is not None:
-        response_json["reminders"] = reminders_override
-        logger.info(f"Reminders override applied: {reminders_override}")
+        event_body["reminders"] = reminders_override
+        logger.info("Reminders override applied: %s", reminders_override)
 
-    logger.info(f"New calendar {item_type}: {response_json}")
+    logger.info("New calendar %s: %s", item_type, event_body)
 
     try:
-        service = build("calendar", "v3", credentials=credentials)
-        event = service.events().insert(calendarId=calendar_id, body=response_json).execute()
-        logger.info(f"New calendar {item_type} created: {event.get('htmlLink')}")
+        event = await asyncio.to_thread(
+            _execute_request, "calendar", "v3", credentials,
+            lambda service: service.events().insert(calendarId=calendar_id, body=event_body)
+        )
+        _matching_events_cache.clear()
+        logger.info("New calendar %s created: %s", item_type, event.get('htmlLink'))
     except HttpError as error:
-        logger.error(f"An error occurred: {error}")
+        logger.error("An error occurred: %s", error)
         return CalendarResponse(
             success=False,
             message=f"An error occurred: {error}",
             calendar_link=None
         )
 
-    attendees_info = response_json.get("attendees", [])
+    attendees_info = event_body.get("attendees", [])
     attendee_str = f" with {attendees_info}" if attendees_info else ""
     return CalendarResponse(
         success=True,
-        message=f"New {item_type} '{response_json['summary']}' created for {response_json['start']['dateTime']}{attendee_str}",
+        message=f"New {item_type} '{details.summary}' created for {details.start.dateTime}{attendee_str}",
         calendar_link=event.get("htmlLink")
     )
 
 
-# Create a new Google Task
-def create_task(credentials, description: str) -> CalendarResponse:
-    """Create a new Google Task in the default task list."""
-    logger.info("Creating a new Google Task")
-    logger.debug(f"Input text: {description}")
-
-    today = datetime.now()
-    date_context = f"Today is {today.strftime('%A, %B %d, %Y')}."
-
-    config = types.GenerateContentConfig(
+@lru_cache(maxsize=2)
+def _create_task_config(date_context: str) -> types.GenerateContentConfig:
+    """Build the create-task config; reused for the rest of the day."""
+    return types.GenerateContentConfig(
         system_instruction=f"""You are a task manager.
         Given the {date_context} create a new task based on the description.
-        Return ONLY these fields in JSON format:
-        - title: string (required — the task name)
-        - notes: string (optional — additional details or context)
-        - due: string (optional — due date in RFC 3339 format, e.g. "2026-03-28T00:00:00.000Z")
-        - status: string ("needsAction" or "completed", default "needsAction")
-        Do not include any other fields.
         """,
         response_mime_type="application/json",
         response_schema=TaskItem
     )
 
-    contents = [
-        types.Content(role="user", parts=[types.Part(text=description)])
-    ]
 
-    response = run_model(model_name, contents, config)
-    response_json = parse_json_response(response)
+# Create a new Google Task
+async def create_task(credentials, description: str) -> CalendarResponse:
+    """Create a new Google Task in the default task list."""
+    logger.info("Creating a new Google Task")
+    logger.debug("Input text: %s", description)
+
+    date_context = _today_context(date_type.today().toordinal())
 
-    logger.info(f"New task details: {response_json}")
+    config = _create_task_config(date_context)
+
+    contents = _user_contents(description)
+
+    response = await arun_model(model_name, contents, config)
+    details = parse_response(response, TaskItem)
+
+    logger.info("New task details: %s", details)
 
     try:
-        service = build("tasks", "v1", credentials=credentials)
-        task = service.tasks().insert(tasklist="@default", body=response_json).execute()
-        logger.info(f"Task created: {task.get('title')}")
+        task = await asyncio.to_thread(
+            _execute_request, "tasks", "v1", credentials,
+            lambda service: service.tasks().insert(tasklist="@default", body=to_api_body(details))
+        )
+        logger.info("Task created: %s", task.get('title'))
     except HttpError as error:
-        logger.error(f"An error occurred: {error}")
+        logger.error("An error occurred: %s", error)
         return CalendarResponse(
             success=False,
             message=f"An error occurred: {error}",
             calendar_link=None
         )
 
-    due_str = f" due {response_json['due']}" if response_json.get("due") else ""
+    due_str = f" due {details.due}" if details.due else ""
     return CalendarResponse(
         success=True,
-        message=f"Task '{response_json['title']}' created successfully{due_str}",
+        message=f"Task '{details.title}' created successfully{due_str}",
         calendar_link=None
     )
 
 
-# Create a new birthday event that repeats yearly
-def create_annual_event(credentials, calendar_id, description: str) -> CalendarResponse:
-    """Create a yearly all-day birthday or anniversary event with default email (1 day) and popup (15 min) reminders."""
-    logger.info("Creating an annual event (birthday or anniversary)")
-    logger.debug(f"Input text: {description}")
-
-    today = datetime.now()
-    date_context = f"Today is {today.strftime('%A, %B %d, %Y')}."
-
-    config = types.GenerateContentConfig(
+@lru_cache(maxsize=2)
+def _annual_event_config(date_context: str) -> types.GenerateContentConfig:
+    """Build the birthday/anniversary config; reused for the rest of the day."""
+    return types.GenerateContentConfig(
         system_instruction=f"""You are a calendar assistant. {date_context}
         Extract the event summary, date, and event type (birthday or anniversary) from the description.
         - For a birthday, format the summary as "<Name>'s Birthday".
@@ -566,18 +881,29 @@ def create_annual_event(credentials, calendar_id, description: str) -> CalendarR
         response_schema=AnnualEventDetails
     )
 
-    contents = [types.Content(role="user", parts=[types.Part(text=description)])]
 
-    response = run_model(model_name, contents, config)
-    details = parse_json_response(response)
+# Create a new birthday event that repeats yearly
+async def create_annual_event(credentials, calendar_id, description: str) -> CalendarResponse:
+    """Create a yearly all-day birthday or anniversary event with default email (1 day) and popup (15 min) reminders."""
+    logger.info("Creating an annual event (birthday or anniversary)")
+    logger.debug("Input text: %s", description)
+
+    date_context = _today_context(date_type.today().toordinal())
+
+    config = _annual_event_config(date_context)
+
+    contents = _user_contents(description)
+
+    response = await arun_model(model_name, contents, config)
+    details = parse_response(response, AnnualEventDetails)
 
-    summary = details["summary"]
-    date_str = details["date"]  # YYYY-MM-DD
-    event_type = details["event_type"]  # "birthday" or "anniversary"
+    summary = details.summary
+    date_str = details.date  # YYYY-MM-DD
+    event_type = details.event_type  # "birthday" or "anniversary"
 
     # Reject annual events whose first occurrence is in the past
     if _is_in_past(date_str):
-        logger.warning(f"Refused to create past annual event: date={date_str}")
+        logger.warning("Refused to create past annual event: date=%s", date_str)
         return CalendarResponse(
             success=False,
             message=f"Cannot create \"{summary}\" with a date in the past ({date_str}). Please provide a future date.",
@@ -609,14 +935,17 @@ def create_annual_event(credentials, calendar_id, description: str) -> CalendarR
         event_body["eventType"] = "birthday"
         event_body["visibility"] = "private"  # required by the API for birthday event type
 
-    logger.info(f"Annual event body: {event_body}")
+    logger.info("Annual event body: %s", event_body)
 
     try:
-        service = build("calendar", "v3", credentials=credentials)
-        event = service.events().insert(calendarId=calendar_id, body=event_body).execute()
-        logger.info(f"Annual event created: {event.get('htmlLink')}")
+        event = await asyncio.to_thread(
+            _execute_request, "calendar", "v3", credentials,
+            lambda service: service.events().insert(calendarId=calendar_id, body=event_body)
+        )
+        _matching_events_cache.clear()
+        logger.info("Annual event created: %s", event.get('htmlLink'))
     except HttpError as error:
-        logger.error(f"An error occurred: {error}")
+        logger.error("An error occurred: %s", error)
         return CalendarResponse(
             success=False,
             message=f"An error occurred: {error}",
@@ -634,14 +963,14 @@ def create_annual_event(credentials, calendar_id, description: str) -> CalendarR
 def delete_event_by_id(credentials, calendar_id, event_id: str) -> CalendarResponse:
     """Delete an existing calendar event by ID."""
     logger.info("Deleting an existing calendar event by ID")
-    logger.info(f"Event ID: {event_id}")
+    logger.info("Event ID: %s", event_id)
 
     try:
-        service = build("calendar", "v3", credentials=credentials)
+        service = get_service("calendar", "v3", credentials)
         service.events().delete(calendarId=calendar_id, eventId=event_id).execute()
-        logger.info(f"Event {event_id} deleted")
+        logger.info("Event %s deleted", event_id)
     except HttpError as error:
-        logger.error(f"An error occurred: {error}")
+        logger.error("An error occurred: %s", error)
         return CalendarResponse(
             success=False,
             message=f"An error occurred: {error}",
@@ -655,14 +984,90 @@ def delete_event_by_id(credentials, calendar_id, event_id: str) -> CalendarRespo
     )
 
 
+# Run API calls using as few HTTP requests as possible
+def _execute_in_batches(service, requests: list) -> tuple[dict, list]:
+    """Execute (request_id, HttpRequest) pairs through batch requests of up to BATCH_SIZE calls each.
+
+    Returns (errors, unattempted): a dict mapping the ID of each request that failed to its
+    error, and the IDs of the requests never run because a whole batch was rejected. Batches
+    after a rejected one are not sent.
+    """
+    logger.info("Executing %s request(s) in batches of %s", len(requests), BATCH_SIZE)
+
+    errors = {}
+
+    def on_response(request_id, response, exception):
+        if exception is not None:
+            logger.error("Request %s failed: %s", request_id, exception)
+            errors[request_id] = exception
+        else:
+            logger.info("Request %s succeeded", request_id)
+
+    for start in range(0, len(requests), BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=on_response)
+        for request_id, request in requests[start:start + BATCH_SIZE]:
+            batch.add(request, request_id=request_id)
+        try:
+            batch.execute()
+        except HttpError as error:
+            logger.warning("Batch request rejected: %s", error)
+            return errors, [request_id for request_id, _ in requests[start:]]
+
+    return errors, []
+
+
+# Delete several calendar events using as few HTTP requests as possible
+def delete_events_in_batches(credentials, calendar_id, events: list) -> tuple[dict, list]:
+    """Delete calendar events in batches; returns (errors, unattempted) as _execute_in_batches does."""
+    service = get_service("calendar", "v3", credentials)
+    return _execute_in_batches(service, [
+        (event["id"], service.events().delete(calendarId=calendar_id, eventId=event["id"]))
+        for event in events
+    ])
+
+
+# Delete several calendar events with one request each, a bounded number at a time
+async def delete_events_concurrently(credentials, calendar_id, events: list) -> dict:
+    """Delete calendar events individually, keeping at most DELETE_CONCURRENCY requests in flight.
+
+    Fallback for when a batch request is rejected as a whole. Returns a dict mapping the
+    ID of each event that could not be deleted to its error, like the batch path's errors.
+    """
+    logger.info("Deleting %s calendar event(s), %s at a time", len(events), DELETE_CONCURRENCY)
+
+    semaphore = asyncio.Semaphore(DELETE_CONCURRENCY)
+    errors = {}
+
+    def delete_one(event_id):
+        # Runs on a worker thread, which gets its own client from get_service
+        service = get_service("calendar", "v3", credentials)
+        service.events().delete(calendarId=calendar_id, eventId=event_id).execute()
+
+    async def delete_bounded(event):
+        async with semaphore:
+            try:
+                await asyncio.to_thread(delete_one, event["id"])
+                logger.info("Event %s deleted", event['id'])
+            except HttpError as error:
+                logger.error("An error occurred deleting event %s: %s", event['id'], error)
+                errors[event["id"]] = error
+
+    await asyncio.gather(*(delete_bounded(event) for event in events))
+    return errors
+
+
 # Delete one or more calendar events given the user's description
-def delete_event(credentials, calendar_id, description: str, all: bool = False) -> CalendarResponse:
+async def delete_event(credentials, calendar_id, description: str, all: bool = False) -> CalendarResponse:
     """Delete one or more calendar meetings or events matching the description."""
     logger.info("Deleting calendar event(s)")
-    logger.info(f"Input text: {description}")
+    logger.info("Input text: %s", description)
 
-    events = get_calendar_events(credentials, calendar_id, description)
-    logger.info(f"Found {len(events)} event(s)")
+    # A single delete needs a single match; the lookup shares the list cache with "show me"
+    params, events = await fetch_matching_events(
+        credentials, calendar_id, description,
+        max_results=None if all else 1
+    )
+    logger.info("Found %s event(s) for %s", len(events), params)
 
     if not events:
         return CalendarResponse(
@@ -672,19 +1077,27 @@ def delete_event(credentials, calendar_id, description: str, all: bool = False)
         )
 
     calResponseMessage = ""
+    _matching_events_cache.clear()
 
     if all:
+        errors, unattempted = await asyncio.to_thread(delete_events_in_batches, credentials, calendar_id, events)
+        if unattempted:
+            # Retry only what the rejected batches never ran; earlier batches already deleted theirs
+            logger.warning("Deleting %s remaining event(s) individually", len(unattempted))
+            unattempted = set(unattempted)
+            remaining = [event for event in events if event["id"] in unattempted]
+            errors.update(await delete_events_concurrently(credentials, calendar_id, remaining))
+
         for event in events:
-            calResponse = delete_event_by_id(credentials, calendar_id, event["id"])
-            if calResponse.success:
-                calResponseMessage += f"Deleted: {event['summary']} ({event['start'].get('dateTime', event['start'].get('date'))})\n"
+            if event["id"] in errors:
+                calResponseMessage += f"Error deleting {event['id']}: An error occurred: {errors[event['id']]}\n"
             else:
-                calResponseMessage += f"Error deleting {event['id']}: {calResponse.message}\n"
+                calResponseMessage += f"Deleted: {event['summary']} ({_event_start(event)})\n"
     else:
         event = events[0]
-        calResponse = delete_event_by_id(credentials, calendar_id, event["id"])
+        calResponse = await asyncio.to_thread(delete_event_by_id, credentials, calendar_id, event["id"])
         if calResponse.success:
-            calResponseMessage = f"Deleted: {event['summary']} ({event['start'].get('dateTime', event['start'].get('date'))})"
+            calResponseMessage = f"Deleted: {event['summary']} ({_event_start(event)})"
         else:
             calResponseMessage = f"Error deleting {event['id']}: {calResponse.message}"
 
@@ -695,11 +1108,21 @@ def delete_event(credentials, calendar_id, description: str, all: bool = False)
     )
 
 
+# Delete several Google Tasks using as few HTTP requests as possible
+def delete_tasks_in_batches(credentials, tasks: list) -> tuple[dict, list]:
+    """Delete tasks from the default task list in batches; returns (errors, unattempted) as _execute_in_batches does."""
+    service = get_service("tasks", "v1", credentials)
+    return _execute_in_batches(service, [
+        (task["id"], service.tasks().delete(tasklist="@default", task=task["id"]))
+        for task in tasks
+    ])
+
+
 # Delete one or more Google Tasks matching the description
 def delete_task(credentials, description: str, all: bool = False) -> CalendarResponse:
     """Delete one or more Google Tasks matching the description."""
     logger.info("Deleting Google Task(s)")
-    logger.info(f"Input text: {description}")
+    logger.info("Input text: %s", description)
 
     tasks = get_tasks(credentials, description)
     if not tasks:
@@ -709,37 +1132,137 @@ def delete_task(credentials, description: str, all: bool = False) -> CalendarRes
             calendar_link=None
         )
 
-    try:
-        service = build("tasks", "v1", credentials=credentials)
-        tasks_to_delete = tasks if all else [tasks[0]]
-        deleted_titles = []
-        for task in tasks_to_delete:
-            service.tasks().delete(tasklist="@default", task=task["id"]).execute()
-            deleted_titles.append(task.get("title", task["id"]))
-            logger.info(f"Task {task['id']} deleted")
-    except HttpError as error:
-        logger.error(f"An error occurred: {error}")
+    tasks_to_delete = tasks if all else [tasks[0]]
+    errors, unattempted = delete_tasks_in_batches(credentials, tasks_to_delete)
+    for task_id in unattempted:
+        errors[task_id] = "the batch request was rejected"
+
+    deleted_titles = [task.get("title", task["id"]) for task in tasks_to_delete if task["id"] not in errors]
+    if not deleted_titles:
         return CalendarResponse(
             success=False,
-            message=f"An error occurred: {error}",
+            message=f"An error occurred: {next(iter(errors.values()))}",
             calendar_link=None
         )
 
+    message = f"Deleted task(s): {', '.join(deleted_titles)}"
+    for task_id, error in errors.items():
+        message += f"\nError deleting {task_id}: An error occurred: {error}"
+
     return CalendarResponse(
         success=True,
-        message=f"Deleted task(s): {', '.join(deleted_titles)}",
+        message=message,
         calendar_link=None
     )
 
 
+# Rules for expressing start/end in model-built event patches
+PATCH_DATETIME_RULES = """IMPORTANT — dateTime format rules:
+        - Express dateTime as local time in the format "YYYY-MM-DDTHH:MM:SS" (no Z, no UTC offset).
+        - Always set the timeZone field to the correct IANA timezone name (e.g. "America/Los_Angeles").
+        - NEVER append "Z" or any UTC offset to dateTime. Adding "Z" overrides timeZone and will place
+          the event at the wrong local time.
+
+        Only include reminders if the user explicitly requests a notification change."""
+
+
+async def _plan_modification(description: str, time_zone: Optional[str] = None) -> ModifyPlan:
+    """Ask the model, in one call, how to find the event to modify and what to change on it."""
+    now = datetime.now(timezone.utc).astimezone()
+    date_context = _today_context(now.toordinal())
+
+    config = types.GenerateContentConfig(
+        system_instruction=f"""You are a Google Calendar manager well versed in the Google Calendar API.
+        Given the {date_context} the user is requesting a modification to an existing calendar event.
+        1. In query, build the parameters to fetch the calendar event referenced in the description.
+        {_list_parameters_rules(now)}
+        2. In patch, set ONLY the fields that are to be modified.
+        {PATCH_DATETIME_RULES}
+        {_time_zone_rule(time_zone)}
+        3. Set confidence_score to how sure you are that the patch is complete without seeing the event's
+           current values. Use a low score when the change is relative to them (e.g. "an hour later",
+           "add 30 minutes", "move to the day after").
+        """,
+        response_mime_type="application/json",
+        response_schema=ModifyPlan
+    )
+
+    contents = _user_contents(description)
+
+    response = await arun_model(model_name, contents, config)
+    plan = parse_response(response, ModifyPlan)
+    logger.info("Modify plan: %s", plan)
+    return plan
+
+
+async def _build_modify_patch(event: dict, description: str, time_zone: Optional[str] = None) -> ModifyEventDetails:
+    """Ask the model for the patch, given the current event; used when the plan's patch is not trusted."""
+    date_context = _today_context(date_type.today().toordinal())
+
+    config = types.GenerateContentConfig(
+        system_instruction=f"""You are a Google Calendar manager well versed in the Google Calendar API.
+        The user is requesting a modification to an existing calendar event '{event}' given that {date_context}.
+        Starting with the current calendar event, create a JSON object to modify the event based on the user's description.
+        Update ONLY the fields that are to be modified.
+
+        {PATCH_DATETIME_RULES}
+        {_time_zone_rule(time_zone)}
+        """,
+        response_mime_type="application/json",
+        response_schema=ModifyEventDetails
+    )
+
+    contents = _user_contents(description)
+
+    response = await arun_model(model_name, contents, config)
+    return parse_response(response, ModifyEventDetails)
+
+
+def _keep_event_duration(event: dict, patch: dict, time_zone: Optional[str] = None) -> None:
+    """Fill in what a timed-event patch leaves out from the current event.
+
+    A new start without an end keeps the event's duration, and a start/end without a
+    timeZone keeps the event's time zone, or else the calendar's (time_zone).
+    """
+    current_start = event.get("start", {})
+    current_end = event.get("end", {})
+    if (
+        patch.get("start", {}).get("dateTime") and "end" not in patch
+        and current_start.get("dateTime") and current_end.get("dateTime")
+    ):
+        try:
+            # Python 3.10's fromisoformat rejects the "Z" suffix the API uses for UTC times
+            duration = (
+                datetime.fromisoformat(current_end["dateTime"].replace("Z", "+00:00"))
+                - datetime.fromisoformat(current_start["dateTime"].replace("Z", "+00:00"))
+            )
+            new_start = datetime.fromisoformat(patch["start"]["dateTime"].replace("Z", "+00:00"))
+        except ValueError as error:
+            logger.warning("Could not keep the event duration: %s", error)
+        else:
+            patch["end"] = {
+                "dateTime": (new_start + duration).strftime("%Y-%m-%dT%H:%M:%S"),
+                **({"timeZone": patch["start"]["timeZone"]} if patch["start"].get("timeZone") else {}),
+            }
+    for field, current in (("start", current_start), ("end", current_end)):
+        if field in patch and "timeZone" not in patch[field] and (current.get("timeZone") or time_zone):
+            patch[field]["timeZone"] = current.get("timeZone") or time_zone
+
+
 # Modify an existing calendar event given the user's description
-def modify_event(credentials, calendar_id, description: str, reminders_override: Optional[dict] = None) -> CalendarResponse:
-    """Modify an existing calendar meeting or event."""
+async def modify_event(credentials, calendar_id, description: str, reminders_override: Optional[dict] = None, time_zone: Optional[str] = None) -> CalendarResponse:
+    """Modify an existing calendar meeting or event.
+
+    One model call plans both the event search and the patch. Only when the patch depends
+    on the event's current values is a second call made, with that event in the prompt.
+    time_zone is the calendar's default time zone, if already known.
+    """
     logger.info("Modifying an existing calendar event")
-    logger.debug(f"Input text: {description}")
+    logger.debug("Input text: %s", description)
 
-    events = get_calendar_events(credentials, calendar_id, description)
-    logger.info(f"Found {len(events)} event(s)")
+    plan = await _plan_modification(description, time_zone)
+    events = await asyncio.to_thread(list_events, credentials, plan.query)
+    logger.info("Found %s event(s)", len(events))
 
     if len(events) == 0:
         return CalendarResponse(
@@ -755,46 +1278,13 @@ def modify_event(credentials, calendar_id, description: str, reminders_override:
         )
 
     event = events[0]
-    logger.info(f"Event to modify: {event['id']}: {event['summary']}")
-
-    today = datetime.now()
-    date_context = f"Today is {today.strftime('%A, %B %d, %Y')}."
-
-    config = types.GenerateContentConfig(
-        system_instruction=f"""You are a Google Calendar manager well versed in the Google Calendar API.
-        The user is requesting a modification to an existing calendar event '{event}' given that {date_context}.
-        Starting with the current calendar event, create a JSON object to modify the event based on the user's description.
-        Update ONLY the fields that are to be modified.
+    logger.info("Event to modify: %s: %s", event['id'], event['summary'])
 
-        IMPORTANT — dateTime format rules:
-        - Express dateTime as local time in the format "YYYY-MM-DDTHH:MM:SS" (no Z, no UTC offset).
-        - Always set the timeZone field to the correct IANA timezone name (e.g. "America/Los_Angeles").
-        - NEVER append "Z" or any UTC offset to dateTime. Adding "Z" overrides timeZone and will place
-          the event at the wrong local time.
-
-        Return ONLY the fields to be modified in JSON format:
-        - summary: string
-        - location: string
-        - description: string
-        - start: object with dateTime (local, no Z) and timeZone (IANA name)
-        - end: object with dateTime (local, no Z) and timeZone (IANA name)
-        - recurrence: array of strings
-        - attendees: array of objects with email field
-        - reminders: object with useDefault (bool) and overrides (array of objects with method and minutes).
-          Only include reminders if the user explicitly requests a notification change.
-          Example: {{"useDefault": false, "overrides": [{{"method": "email", "minutes": 1440}}, {{"method": "popup", "minutes": 30}}]}}
-        Do not include any other fields or properties.
-        """,
-        response_mime_type="application/json",
-        response_schema=NewEventDetails
-    )
-
-    contents = [
-        types.Content(role="user", parts=[types.Part(text=description)])
-    ]
-
-    response = run_model(model_name, contents, config)
-    response_json = parse_json_response(response)
+    patch = plan.patch
+    if plan.confidence_score <= 0.7:
+        logger.info("Low plan confidence (%.2f), rebuilding the patch from the event", plan.confidence_score)
+        patch = await _build_modify_patch(event, description, time_zone)
+    response_json = to_api_body(patch)
 
     # If the original event is an all-day event, ensure start/end use "date" not "dateTime"
     is_all_day = "date" in event.get("start", {}) and "dateTime" not in event.get("start", {})
@@ -804,12 +1294,14 @@ def modify_event(credentials, calendar_id, description: str, reminders_override:
                 dt_str = response_json[field]["dateTime"]
                 date_only = dt_str[:10]  # extract YYYY-MM-DD
                 response_json[field] = {"date": date_only}
+    else:
+        _keep_event_duration(event, response_json, time_zone)
 
     # Reject modifications that would move the event to a past date/time
     new_start = response_json.get("start", {})
     new_start_dt = new_start.get("dateTime") or new_start.get("date")
     if new_start_dt and _is_in_past(new_start_dt):
-        logger.warning(f"Refused to modify event to past time: start={new_start_dt}")
+        logger.warning("Refused to modify event to past time: start=%s", new_start_dt)
         return CalendarResponse(
             success=False,
             message=f"Cannot reschedule \"{event['summary']}\" to a time in the past ({new_start_dt}). Please provide a future date and time.",
@@ -819,18 +1311,19 @@ def modify_event(credentials, calendar_id, description: str, reminders_override:
     # UI-supplied reminders take precedence over LLM-extracted reminders
     if reminders_override is not None:
         response_json["reminders"] = reminders_override
-        logger.info(f"Reminders override applied: {reminders_override}")
+        logger.info("Reminders override applied: %s", reminders_override)
 
-    logger.info(f"Update calendar event: {response_json}")
+    logger.info("Update calendar event: %s", response_json)
 
     try:
-        service = build("calendar", "v3", credentials=credentials)
-        updated_event = service.events().patch(
-            calendarId=calendar_id, eventId=event["id"], body=response_json
-        ).execute()
-        logger.info(f"Event {event['id']} successfully modified")
+        updated_event = await asyncio.to_thread(
+            _execute_request, "calendar", "v3", credentials,
+            lambda service: service.events().patch(calendarId=calendar_id, eventId=event["id"], body=response_json)
+        )
+        _matching_events_cache.clear()
+        logger.info("Event %s successfully modified", event['id'])
     except HttpError as error:
-        logger.error(f"An error occurred while modifying the event ({event['id']}): {error}")
+        logger.error("An error occurred while modifying the event (%s): %s", event['id'], error)
         return CalendarResponse(
             success=False,
             message=f"An error occurred while modifying the event ({event['id']}): {error}",
@@ -839,18 +1332,18 @@ def modify_event(credentials, calendar_id, description: str, reminders_override:
 
     return CalendarResponse(
         success=True,
-        message=f"Modified: {events[0]['summary']} ({events[0]['start'].get('dateTime', events[0]['start'].get('date'))})",
+        message=f"Modified: {events[0]['summary']} ({_event_start(events[0])})",
         calendar_link=None
     )
 
 
 # Modify an existing Google Task given the user's description
-def modify_task(credentials, description: str) -> CalendarResponse:
+async def modify_task(credentials, description: str) -> CalendarResponse:
     """Modify an existing Google Task."""
     logger.info("Modifying an existing Google Task")
-    logger.debug(f"Input text: {description}")
+    logger.debug("Input text: %s", description)
 
-    tasks = get_tasks(credentials, description)
+    tasks = await asyncio.to_thread(get_tasks, credentials, description)
     if not tasks:
         return CalendarResponse(
             success=False,
@@ -865,42 +1358,34 @@ def modify_task(credentials, description: str) -> CalendarResponse:
         )
 
     task = tasks[0]
-    logger.info(f"Task to modify: {task['id']}: {task.get('title')}")
+    logger.info("Task to modify: %s: %s", task['id'], task.get('title'))
 
-    today = datetime.now()
-    date_context = f"Today is {today.strftime('%A, %B %d, %Y')}."
+    date_context = _today_context(date_type.today().toordinal())
 
     config = types.GenerateContentConfig(
         system_instruction=f"""You are a task manager.
         The user wants to modify the existing task '{task}' given that {date_context}.
-        Based on the description, create a JSON object with only the fields that need to change:
-        - title: string
-        - notes: string
-        - due: string (RFC 3339 format, e.g. "2026-03-28T00:00:00.000Z")
-        - status: string ("needsAction" or "completed")
-        Do not include fields that are not being changed.
+        Based on the description, create a JSON object with only the fields that need to change.
         """,
         response_mime_type="application/json",
         response_schema=TaskItem
     )
 
-    contents = [
-        types.Content(role="user", parts=[types.Part(text=description)])
-    ]
+    contents = _user_contents(description)
 
-    response = run_model(model_name, contents, config)
-    response_json = parse_json_response(response)
+    response = await arun_model(model_name, contents, config)
+    response_json = to_api_body(parse_response(response, TaskItem))
 
-    logger.info(f"Task update payload: {response_json}")
+    logger.info("Task update payload: %s", response_json)
 
     try:
-        service = build("tasks", "v1", credentials=credentials)
-        service.tasks().patch(
-            tasklist="@default", task=task["id"], body=response_json
-        ).execute()
-        logger.info(f"Task {task['id']} modified")
+        await asyncio.to_thread(
+            _execute_request, "tasks", "v1", credentials,
+            lambda service: service.tasks().patch(tasklist="@default", task=task["id"], body=response_json)
+        )
+        logger.info("Task %s modified", task['id'])
     except HttpError as error:
-        logger.error(f"An error occurred: {error}")
+        logger.error("An error occurred: %s", error)
         return CalendarResponse(
             success=False,
             message=f"An error occurred: {error}",
@@ -918,53 +1403,89 @@ def modify_task(credentials, description: str) -> CalendarResponse:
 # Step 3: Route the calendar/task request to the appropriate handler
 # ---------------------------------------------------------------------------------
 
-def process_calendar_request(credentials, calendar_id, user_input: str, reminders_override: Optional[dict] = None) -> Optional[CalendarResponse]:
+async def process_calendar_request(credentials, calendar_id, user_input: str, reminders_override: Optional[dict] = None) -> Optional[CalendarResponse]:
     """Process an incoming calendar or task request and route to the correct handler."""
-    logger.info(f"Processing request: {user_input}")
+    logger.info("Processing request: %s", user_input)
+
+    # Unless it is already cached, fetch the calendar's time zone on a worker thread while
+    # the request is classified; only the event create/modify handlers wait for it
+    time_zone_key = (credentials, calendar_id)
+    cached_time_zone = _time_zone_cache.get(time_zone_key)
+    time_zone_task = None
+    if cached_time_zone is None:
+        time_zone_task = asyncio.create_task(asyncio.to_thread(get_calendar_time_zone, credentials, calendar_id))
+
+    async def calendar_time_zone() -> Optional[str]:
+        if time_zone_task is None:
+            return cached_time_zone
+        try:
+            time_zone = await time_zone_task
+        except Exception as error:
+            # The time zone only improves the prompt; go on without it
+            logger.warning("Could not fetch the calendar time zone: %s", error)
+            return None
+        # Stored here, on the event loop, like the other response caches; failures are not kept
+        if time_zone:
+            _time_zone_cache.put(time_zone_key, time_zone)
+        return time_zone
+
+    try:
+        return await _route_request(credentials, calendar_id, user_input, reminders_override, calendar_time_zone)
+    finally:
+        # Task, annual, delete, and rejected requests never use the time zone
+        if time_zone_task is not None and not time_zone_task.done():
+            time_zone_task.cancel()
 
-    # Step 1: Check if this is a calendar/task request at all
-    is_calendar_event = check_if_calendar_event(user_input)
-    if not (is_calendar_event["is_calendar_event"] and is_calendar_event["confidence_score"] > 0.7):
-        logger.warning("Request is not a recognized calendar or task request")
-        return None
 
-    # Step 2: Classify action and item type
-    request_type = determine_calendar_request_type(user_input)
-    logger.info(f"Request type: {request_type}")
+async def _route_request(credentials, calendar_id, user_input: str, reminders_override: Optional[dict], calendar_time_zone) -> Optional[CalendarResponse]:
+    """Classify the request and call its handler; calendar_time_zone() resolves the calendar's time zone."""
+    # Steps 1 and 2: check whether this is a calendar/task request and classify it
+    request_type = await classify_request(user_input)
+    logger.info("Request type: %s", request_type)
 
-    action = request_type.get("action", "other")
-    item_type = request_type.get("item_type", "unknown")
-    description = request_type.get("description", user_input)
-    confidence = request_type.get("confidence_score", 0)
+    action = request_type.action
+    item_type = request_type.item_type
+    description = request_type.description or user_input
+    confidence = request_type.confidence_score
+
+    if not request_type.is_calendar_event:
+        logger.warning("Request is not a recognized calendar or task request")
+        return None
 
     if confidence <= 0.7:
-        logger.warning(f"Low confidence ({confidence:.2f}), skipping")
+        logger.warning("Low confidence (%.2f), skipping", confidence)
         return None
 
     # Step 3: Route to the appropriate handler
     if action == "new":
         if item_type == "task":
-            return create_task(credentials, description)
+            return await create_task(credentials, description)
         elif item_type in ("birthday", "anniversary"):
-            return create_annual_event(credentials, calendar_id, description)
+            return await create_annual_event(credentials, calendar_id, description)
         else:
             # Both "meeting" and "event" use the calendar API; item_type controls attendee handling
-            return create_new_event(credentials, calendar_id, description, item_type=item_type, reminders_override=reminders_override)
+            return await create_new_event(
+                credentials, calendar_id, description, item_type=item_type,
+                reminders_override=reminders_override, time_zone=await calendar_time_zone()
+            )
 
     elif action == "modify":
         if item_type == "task":
-            return modify_task(credentials, description)
+            return await modify_task(credentials, description)
         else:
-            return modify_event(credentials, calendar_id, description, reminders_override=reminders_override)
+            return await modify_event(
+                credentials, calendar_id, description,
+                reminders_override=reminders_override, time_zone=await calendar_time_zone()
+            )
 
     elif action == "delete":
         if item_type == "task":
-            return delete_task(credentials, description)
+            return await asyncio.to_thread(delete_task, credentials, description)
         else:
-            return delete_event(credentials, calendar_id, description)
+            return await delete_event(credentials, calendar_id, description)
 
     else:
-        logger.warning(f"Unsupported action '{action}' for item type '{item_type}'")
+        logger.warning("Unsupported action '%s' for item type '%s'", action, item_type)
         return None
 
 
@@ -972,21 +1493,8 @@ def process_calendar_request(credentials, calendar_id, user_input: str, reminder
 # Step 4: Define the main function to run the calendar agent
 # --------------------------------------------------------------
 
-def main():
-    """Run the calendar agent interactively from the command line."""
-
-    creds = None
-    if os.path.exists("token.json"):
-        creds = Credentials.from_authorized_user_file("token.json", SCOPES)
-    if not creds or not creds.valid:
-        if creds and creds.expired and creds.refresh_token:
-            creds.refresh(Request())
-        else:
-            flow = InstalledAppFlow.from_client_secrets_file("credentials.json", SCOPES)
-            creds = flow.run_local_server(port=0)
-        with open("token.json", "w") as token:
-            token.write(creds.to_json())
-
+async def run_repl(creds):
+    """Read requests from the command line and process them until the user quits."""
     print("\n=== Google Calendar Agent ===")
     print("Describe a meeting, event, or task you want to create, modify, or delete.")
     print("Examples:")
@@ -996,7 +1504,8 @@ def main():
     print("Type 'quit' to exit.\n")
 
     while True:
-        user_input = input("Enter request: ").strip()
+        # Read input on a worker thread so the event loop is not blocked while waiting
+        user_input = (await asyncio.to_thread(input, "Enter request: ")).strip()
 
         if user_input.lower() in ["quit", "exit", "q"]:
             print("Goodbye!")
@@ -1007,7 +1516,7 @@ def main():
             continue
 
         print(f"\nProcessing: {user_input}")
-        result = process_calendar_request(creds, "primary", user_input)
+        result = await process_calendar_request(creds, "primary", user_input)
 
         if result and result.success:
             print(f"✅ {result.message}")
@@ -1018,5 +1527,58 @@ def main():
         print("\n" + "=" * 50 + "\n")
 
 
+def save_token_in_background(creds, path: str = "token.json") -> threading.Thread:
+    """Write creds to path on a worker thread, skipping the write if the file already matches.
+
+    The thread is not a daemon, so the interpreter waits for the write before exiting
+    even if the user quits straight away.
+    """
+    token_json = creds.to_json()
+
+    def write():
+        try:
+            with open(path) as token:
+                if token.read() == token_json:
+                    return
+        except FileNotFoundError:
+            pass
+        with open(path, "w") as token:
+            token.write(token_json)
+        logger.info("Saved token to %s", path)
+
+    thread = threading.Thread(target=write, name="token-writer")
+    thread.start()
+    return thread
+
+
+def load_cli_credentials():
+    """Load token.json, refreshing it or running the OAuth flow when it is not valid."""
+    creds = None
+    if os.path.exists("token.json"):
+        creds = Credentials.from_authorized_user_file("token.json", SCOPES)
+    if not creds or not creds.valid:
+        if creds and creds.expired and creds.refresh_token:
+            creds.refresh(Request())
+        else:
+            flow = InstalledAppFlow.from_client_secrets_file("credentials.json", SCOPES)
+            creds = flow.run_local_server(port=0)
+        # Persist both refreshed and newly granted tokens, without holding up the prompt
+        save_token_in_background(creds)
+    return creds
+
+
+async def run_cli():
+    """Warm up the Gemini connection while credentials load, then run the REPL."""
+    warm_up = asyncio.create_task(warm_up_model_client())
+    creds = await asyncio.to_thread(load_cli_credentials)
+    await run_repl(creds)
+    await warm_up
+
+
+def main():
+    """Run the calendar agent interactively from the command line."""
+    asyncio.run(run_cli())
+
+
 if __name__ == "__main__":
     main()